@@ -9,12 +9,41 @@ complement traditional pattern-based detection with semantic understanding.
 import os
 import json
 import logging
-from typing import Dict, List, Any, Optional, Set
+import random
+from typing import Dict, List, Any, Optional, Set, Iterable
 
 from repo_analyzer.ai.ai_integration import AIIntegration
 
 logger = logging.getLogger(__name__)
 
+def _reservoir_sample(items: Iterable[str], k: int) -> List[str]:
+    """
+    Select up to k items uniformly at random from an iterable in one pass.
+    
+    Uses reservoir sampling (Algorithm R), so memory stays O(k) no matter
+    how many items the iterable yields.
+    
+    Args:
+        items: Iterable of items to sample from
+        k: Maximum number of items to select
+        
+    Returns:
+        List of at most k selected items
+    """
+    reservoir = []
+    if k <= 0:
+        return reservoir
+    
+    for i, item in enumerate(items):
+        if i < k:
+            reservoir.append(item)
+        else:
+            j = random.randrange(i + 1)
+            if j < k:
+                reservoir[j] = item
+    
+    return reservoir
+
 class AIDetector:
     """
     AI-enhanced detector for repository analysis.
@@ -317,9 +346,10 @@ class AIDetector:
         # If we still need more files, add some from different directories
         if len(selected_files) < max_files:
             # Group files by directory
+            already_selected = set(selected_files)
             dir_files = {}
             for file_path in files:
-                if file_path in files_content and file_path not in selected_files:
+                if file_path in files_content and file_path not in already_selected:
                     directory = os.path.dirname(file_path)
                     if directory not in dir_files:
                         dir_files[directory] = []
@@ -408,18 +438,16 @@ class AIDetector:
         
         # Add some randomly selected files from different directories if needed
         if len(selected_files) < max_files:
-            import random
+            already_selected = set(selected_files)
             
-            # Filter to files that are not too large
-            eligible_files = [f for f in files if f in files_content 
-                            and f not in selected_files 
-                            and len(files_content[f]) < 50000]
+            # Stream files that are not too large without building a full list
+            eligible_files = (f for f in files if f in files_content 
+                              and f not in already_selected 
+                              and len(files_content[f]) < 50000)
             
-            # Shuffle and select remaining files
-            if eligible_files:
-                random.shuffle(eligible_files)
-                remaining_slots = max_files - len(selected_files)
-                selected_files.extend(eligible_files[:remaining_slots])
+            # Keep a uniform random sample of the remaining slots
+            remaining_slots = max_files - len(selected_files)
+            selected_files.extend(_reservoir_sample(eligible_files, remaining_slots))
         
         return selected_files
     
@@ -597,6 +625,10 @@ class AIDetector:
             "suggestions": []
         }
         
+        # Texts of the suggestions kept so far; the same advice often comes
+        # back for many files, and a set makes each duplicate check O(1)
+        seen_suggestion_texts = set()
+        
         # Aggregate technologies across all files
         for file_path, result in self.file_results.items():
             if "technologies" in result:
@@ -627,13 +659,8 @@ class AIDetector:
             if "suggestions" in result:
                 for suggestion in result["suggestions"]:
                     # Check if we already have a similar suggestion
-                    is_duplicate = False
-                    for existing in aggregated["suggestions"]:
-                        if suggestion["text"] == existing["text"]:
-                            is_duplicate = True
-                            break
-                    
-                    if not is_duplicate:
+                    if suggestion["text"] not in seen_suggestion_texts:
+                        seen_suggestion_texts.add(suggestion["text"])
                         # Add source file info to suggestion
                         suggestion["file"] = file_path
                         aggregated["suggestions"].append(suggestion)
@@ -677,6 +704,9 @@ class AIDetector:
             "suggestions": []
         }
         
+        # Architecture suggestions are kept once per text, across all files
+        seen_suggestion_texts = set()
+        
         # Aggregate patterns across all files
         for file_path, result in results.items():
             if "patterns" in result:
@@ -707,13 +737,8 @@ class AIDetector:
             if "suggestions" in result:
                 for suggestion in result["suggestions"]:
                     # Check if we already have a similar suggestion
-                    is_duplicate = False
-                    for existing in aggregated["suggestions"]:
-                        if suggestion["text"] == existing["text"]:
-                            is_duplicate = True
-                            break
-                    
-                    if not is_duplicate:
+                    if suggestion["text"] not in seen_suggestion_texts:
+                        seen_suggestion_texts.add(suggestion["text"])
                         # Add source file info to suggestion
                         suggestion["file"] = file_path
                         aggregated["suggestions"].append(suggestion)
@@ -772,6 +797,8 @@ class AIDetector:
             "performance": []
         }
         
+        seen_suggestion_texts = set()
+        
         # Aggregate quality assessments across all files
         for file_path, result in results.items():
             if "quality_assessment" in result:
@@ -808,13 +835,8 @@ class AIDetector:
             if "suggestions" in result:
                 for suggestion in result["suggestions"]:
                     # Check if we already have a similar suggestion
-                    is_duplicate = False
-                    for existing in aggregated["suggestions"]:
-                        if suggestion["text"] == existing["text"]:
-                            is_duplicate = True
-                            break
-                    
-                    if not is_duplicate:
+                    if suggestion["text"] not in seen_suggestion_texts:
+                        seen_suggestion_texts.add(suggestion["text"])
                         # Add source file info to suggestion
                         suggestion["file"] = file_path
                         aggregated["suggestions"].append(suggestion)
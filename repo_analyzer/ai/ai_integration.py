@@ -362,6 +362,9 @@ class AIIntegration:
         lines = code.split('\n')
         chunks = []
         current_chunk = []
+        # Token count of each line in current_chunk, so overlap lines carried
+        # into the next chunk are not run through the tokenizer again
+        current_tokens = []
         current_size = 0
         
         for line in lines:
@@ -372,11 +375,13 @@ class AIIntegration:
                 chunks.append('\n'.join(current_chunk))
                 
                 # Keep the last few lines for overlap
-                overlap_lines = current_chunk[-chunk_overlap:] if chunk_overlap < len(current_chunk) else current_chunk
-                current_chunk = overlap_lines
-                current_size = sum(self.count_tokens(l) for l in current_chunk)
+                if chunk_overlap < len(current_chunk):
+                    current_chunk = current_chunk[-chunk_overlap:]
+                    current_tokens = current_tokens[-chunk_overlap:]
+                current_size = sum(current_tokens)
             
             current_chunk.append(line)
+            current_tokens.append(line_tokens)
             current_size += line_tokens
         
         # Add the last chunk if not empty
@@ -453,7 +458,7 @@ class AIIntegration:
             suggestion_texts = set()
             for suggestion in all_suggestions:
                 # Use the first sentence as a key for deduplication
-                key = suggestion["text"].split(".")[0]
+                key = suggestion["text"].partition(".")[0]
                 if key not in suggestion_texts:
                     suggestion_texts.add(key)
                     unique_suggestions.append(suggestion)
@@ -856,8 +861,9 @@ class AIIntegration:
         # Combine all inputs into a single string
         combined = f"{content}{operation}{extras or ''}{self.config['model']}"
         
-        # Create a hash of the combined string
-        hash_obj = hashlib.md5(combined.encode('utf-8'))
+        # Create a hash of the combined string (BLAKE2b is faster than MD5 on
+        # 64-bit CPUs; a 16-byte digest keeps keys the same length as before)
+        hash_obj = hashlib.blake2b(combined.encode('utf-8'), digest_size=16)
         return hash_obj.hexdigest()
     
     def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
@@ -875,15 +881,16 @@ class AIIntegration:
             
         cache_file = Path(self.config["cache_dir"]) / f"{cache_key}.json"
         
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Error reading cache file: {str(e)}")
-                return None
-        
-        return None
+        # Open directly instead of checking exists() first, so a cache hit
+        # costs one path lookup rather than two
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Error reading cache file: {str(e)}")
+            return None
     
     def _cache_result(self, cache_key: str, result: Dict[str, Any]) -> None:
         """
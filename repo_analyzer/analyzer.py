@@ -6,9 +6,11 @@ validation, and additional context-aware analysis to reduce false positives.
 """
 
 import os
+import heapq
 import logging
 import json
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Set, Union
 
@@ -28,6 +30,34 @@ from repo_analyzer.config import RepoAnalyzerConfig
 
 logger = logging.getLogger(__name__)
 
+# Detector calls held by each worker process of RepoAnalyzer._run_detectors.
+# They are installed once per worker by the pool initializer, so the loaded
+# file contents are not pickled again for every submitted detector.
+_worker_calls: Dict[str, tuple] = {}
+
+def _init_detector_worker(calls: Dict[str, tuple]) -> None:
+    """
+    Store the detector calls for this worker process.
+    
+    Args:
+        calls: Dict mapping result names to (detect method, args) tuples
+    """
+    global _worker_calls
+    _worker_calls = calls
+
+def _run_detector_call(name: str) -> Any:
+    """
+    Run one of the detector calls stored by _init_detector_worker.
+    
+    Args:
+        name: Result name of the detector call to run
+        
+    Returns:
+        The value returned by the detector
+    """
+    method, args = _worker_calls[name]
+    return method(*args)
+
 class RepoAnalyzer:
     """
     Enhanced main class for analyzing code repositories.
@@ -49,7 +79,7 @@ class RepoAnalyzer:
     
     def __init__(self, repo_path: str, exclude_dirs: Optional[Set[str]] = None, 
                  max_file_size: int = 5 * 1024 * 1024, verbose: bool = False,
-                 config_path: Optional[str] = None):
+                 config_path: Optional[str] = None, jobs: int = 1):
         """
         Initialize the RepoAnalyzer.
         
@@ -60,6 +90,8 @@ class RepoAnalyzer:
             max_file_size: Maximum file size in bytes to analyze (default: 5MB)
             verbose: Whether to print verbose output during analysis
             config_path: Path to configuration file (optional)
+            jobs: Number of worker processes used to run the content
+                  detectors (default: 1, i.e. run in-process)
         """
         self.repo_path = os.path.abspath(repo_path)
         if not os.path.isdir(self.repo_path):
@@ -73,6 +105,7 @@ class RepoAnalyzer:
         
         self.max_file_size = max_file_size
         self.verbose = verbose
+        self.jobs = max(1, jobs or 1)
         
         # Configure logging based on verbosity
         log_level = logging.INFO if verbose else logging.WARNING
@@ -147,37 +180,52 @@ class RepoAnalyzer:
         self.files_with_content_analyzed = len(files_content)
         logger.info(f"Loaded content of {self.files_with_content_analyzed} files for deeper analysis")
         
+        # Steps 4-10: Run the content detectors (in parallel when jobs > 1)
+        detector_results = self._run_detectors({
+            "frameworks": (self.framework_detector.detect, (all_files, files_content)),
+            "databases": (self.database_detector.detect, (files_content,)),
+            "build": (self.build_detector.detect, (all_files, files_content)),
+            "frontend": (self.frontend_detector.detect, (all_files, files_content)),
+            "devops": (self.devops_detector.detect, (all_files, files_content)),
+            "architecture": (self.architecture_detector.detect, (all_files, files_content)),
+            "testing": (self.testing_detector.detect, (all_files, files_content)),
+        })
+        
+        # File contents are not needed past the detectors; release them before
+        # the result post-processing steps to lower peak memory
+        del files_content
+        
         # Step 4: Detect frameworks
-        self.tech_stack["frameworks"] = self.framework_detector.detect(all_files, files_content)
+        self.tech_stack["frameworks"] = detector_results["frameworks"]
         logger.info(f"Detected {len(self.tech_stack['frameworks'])} frameworks")
         
         # Cache primary frameworks for cross-detector validation
         self._cache["primary_frameworks"] = self._get_highest_confidence_items("frameworks", 1)
         
         # Step 5: Detect databases
-        self.tech_stack["databases"] = self.database_detector.detect(files_content)
+        self.tech_stack["databases"] = detector_results["databases"]
         logger.info(f"Detected {len(self.tech_stack['databases'])} database technologies")
         
         # Step 6: Detect build systems and package managers
-        build_systems, package_managers = self.build_detector.detect(all_files, files_content)
+        build_systems, package_managers = detector_results["build"]
         self.tech_stack["build_systems"] = build_systems
         self.tech_stack["package_managers"] = package_managers
         logger.info(f"Detected {len(build_systems)} build systems and {len(package_managers)} package managers")
         
         # Step 7: Detect frontend technologies
-        self.tech_stack["frontend"] = self.frontend_detector.detect(all_files, files_content)
+        self.tech_stack["frontend"] = detector_results["frontend"]
         logger.info(f"Detected {len(self.tech_stack['frontend'])} frontend technologies")
         
         # Step 8: Detect DevOps tools
-        self.tech_stack["devops"] = self.devops_detector.detect(all_files, files_content)
+        self.tech_stack["devops"] = detector_results["devops"]
         logger.info(f"Detected {len(self.tech_stack['devops'])} DevOps tools")
         
         # Step 9: Detect architecture patterns
-        self.tech_stack["architecture"] = self.architecture_detector.detect(all_files, files_content)
+        self.tech_stack["architecture"] = detector_results["architecture"]
         logger.info(f"Detected {len(self.tech_stack['architecture'])} architecture patterns")
         
         # Step 10: Detect testing frameworks
-        self.tech_stack["testing"] = self.testing_detector.detect(all_files, files_content)
+        self.tech_stack["testing"] = detector_results["testing"]
         logger.info(f"Detected {len(self.tech_stack['testing'])} testing frameworks")
         
         # Step 11: Cross-validate and refine detections
@@ -203,6 +251,32 @@ class RepoAnalyzer:
         
         return self.tech_stack
     
+    def _run_detectors(self, calls: Dict[str, tuple]) -> Dict[str, Any]:
+        """
+        Run independent detector calls, sharing one process pool when jobs > 1.
+        
+        The detectors are CPU-bound on regex matching and do not depend on each
+        other's results, so each one can run in its own worker process. The
+        calls (including the loaded file contents) are handed to each worker
+        once through the pool initializer, and tasks only carry the result
+        name. With jobs == 1 (the default) they run sequentially in the
+        current process.
+        
+        Args:
+            calls: Dict mapping result names to (detect method, args) tuples
+            
+        Returns:
+            Dict mapping result names to the value returned by each detector
+        """
+        if self.jobs <= 1:
+            return {name: method(*args) for name, (method, args) in calls.items()}
+        
+        with ProcessPoolExecutor(max_workers=min(self.jobs, len(calls)),
+                                 initializer=_init_detector_worker,
+                                 initargs=(calls,)) as executor:
+            futures = {name: executor.submit(_run_detector_call, name) for name in calls}
+            return {name: future.result() for name, future in futures.items()}
+    
     def _determine_primary_languages(self) -> List[str]:
         """
         Determine primary languages based on confidence scores and usage.
@@ -214,10 +288,10 @@ class RepoAnalyzer:
             return []
         
         # Find languages with confidence scores
-        langs_with_confidence = []
-        for lang, data in self.tech_stack["languages"].items():
-            if isinstance(data, dict) and "confidence" in data:
-                langs_with_confidence.append((lang, data["confidence"]))
+        langs_with_confidence = [
+            (lang, data["confidence"]) for lang, data in self.tech_stack["languages"].items()
+            if isinstance(data, dict) and "confidence" in data
+        ]
         
         # Sort by confidence (highest first)
         if langs_with_confidence:
@@ -246,17 +320,16 @@ class RepoAnalyzer:
             return []
         
         # Find items with confidence scores
-        items_with_confidence = []
-        for item, data in self.tech_stack[category].items():
-            if isinstance(data, dict) and "confidence" in data:
-                items_with_confidence.append((item, data["confidence"]))
+        items_with_confidence = [
+            (item, data["confidence"]) for item, data in self.tech_stack[category].items()
+            if isinstance(data, dict) and "confidence" in data
+        ]
         
-        # Sort by confidence (highest first)
+        # Select the top N items by confidence (highest first). nlargest keeps
+        # a heap of N items instead of sorting the whole category
         if items_with_confidence:
-            items_with_confidence.sort(key=lambda x: x[1], reverse=True)
-            
-            # Return top N items
-            return [item for item, _ in items_with_confidence[:count]]
+            top_items = heapq.nlargest(count, items_with_confidence, key=lambda x: x[1])
+            return [item for item, _ in top_items]
         
         return []
     
@@ -391,7 +464,7 @@ class RepoAnalyzer:
         min_confidence = self.config.get("min_confidence", 15)
         
         for category in self.tech_stack:
-            if category in ["metadata", "primary_technologies"]:
+            if category in {"metadata", "primary_technologies"}:
                 continue
                 
             # Filter technologies by confidence
@@ -415,20 +488,20 @@ class RepoAnalyzer:
         
         for category in self.tech_stack:
             # Skip metadata and primary_technologies itself
-            if category in ["metadata", "primary_technologies"]:
+            if category in {"metadata", "primary_technologies"}:
                 continue
                 
             if isinstance(self.tech_stack[category], dict) and self.tech_stack[category]:
                 # Find technologies with confidence scores
-                techs_with_confidence = []
-                for tech, data in self.tech_stack[category].items():
-                    if isinstance(data, dict) and "confidence" in data:
-                        techs_with_confidence.append((tech, data["confidence"]))
+                techs_with_confidence = [
+                    (tech, data["confidence"]) for tech, data in self.tech_stack[category].items()
+                    if isinstance(data, dict) and "confidence" in data
+                ]
                 
-                # Sort by confidence (highest first)
+                # Pick the highest-confidence technology; only the top entry is
+                # needed, so a single max() pass replaces a full sort
                 if techs_with_confidence:
-                    techs_with_confidence.sort(key=lambda x: x[1], reverse=True)
-                    primary_tech[category] = techs_with_confidence[0][0]
+                    primary_tech[category] = max(techs_with_confidence, key=lambda x: x[1])[0]
         
         return primary_tech
     
@@ -486,10 +559,10 @@ class RepoAnalyzer:
             if techs:
                 print(f"{category.replace('_', ' ').title()}:")
                 # Sort by confidence
-                sorted_techs = []
-                for tech, details in techs.items():
-                    confidence = details.get("confidence", 0) if isinstance(details, dict) else 0
-                    sorted_techs.append((tech, confidence))
+                sorted_techs = [
+                    (tech, details.get("confidence", 0) if isinstance(details, dict) else 0)
+                    for tech, details in techs.items()
+                ]
                 
                 sorted_techs.sort(key=lambda x: x[1], reverse=True)
                 
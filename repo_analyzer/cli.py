@@ -112,6 +112,13 @@ def parse_arguments() -> argparse.Namespace:
         default=5 * 1024 * 1024,  # 5MB
         help="Maximum file size in bytes to analyze"
     )
+    analysis_group.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes used to run the detectors "
+             "(1 runs them in-process; larger values pay off on big repositories)"
+    )
     
     # Visualization options
     viz_group = parser.add_argument_group("Visualization Options")
@@ -552,7 +559,8 @@ def main():
             repo_path=args.repo_path,
             exclude_dirs=exclude_dirs,
             max_file_size=args.max_file_size,
-            verbose=args.verbose and not args.quiet
+            verbose=args.verbose and not args.quiet,
+            jobs=args.jobs
         )
         
         # Run analysis
@@ -101,7 +101,12 @@ class RepoAnalyzerConfig:
                 elif config_path.endswith(('.yaml', '.yml')):
                     try:
                         import yaml
-                        file_config = yaml.safe_load(f)
+                        # Prefer the libyaml-backed loader when available
+                        loader = getattr(yaml, 'CSafeLoader', None)
+                        if loader is None:
+                            logger.debug("PyYAML was built without libyaml; using the slower pure-Python loader.")
+                            loader = yaml.SafeLoader
+                        file_config = yaml.load(f, Loader=loader)
                     except ImportError:
                         logger.warning("PyYAML is not installed. Cannot load YAML configuration.")
                         return
@@ -161,7 +166,7 @@ class RepoAnalyzerConfig:
         """
         # Handle nested configuration
         if '.' in key:
-            parent_key, child_key = key.split('.', 1)
+            parent_key, _, child_key = key.partition('.')
             if parent_key in self.config and isinstance(self.config[parent_key], dict):
                 self.config[parent_key][child_key] = value
             return
@@ -213,7 +218,7 @@ class RepoAnalyzerConfig:
         """
         # Handle nested configuration
         if '.' in key:
-            parent_key, child_key = key.split('.', 1)
+            parent_key, _, child_key = key.partition('.')
             parent = self.config.get(parent_key, {})
             if isinstance(parent, dict):
                 return parent.get(child_key, default)
@@ -300,8 +305,12 @@ class RepoAnalyzerConfig:
             elif config_path.endswith(('.yaml', '.yml')):
                 try:
                     import yaml
+                    dumper = getattr(yaml, 'CSafeDumper', None)
+                    if dumper is None:
+                        logger.debug("PyYAML was built without libyaml; using the slower pure-Python dumper.")
+                        dumper = yaml.SafeDumper
                     with open(config_path, 'w') as f:
-                        yaml.dump(self.config, f, default_flow_style=False)
+                        yaml.dump(self.config, f, Dumper=dumper, default_flow_style=False)
                 except ImportError:
                     logger.warning("PyYAML is not installed. Cannot save YAML configuration.")
                     return
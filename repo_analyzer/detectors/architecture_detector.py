@@ -225,6 +225,17 @@ class ArchitectureDetector:
             "swagger": "REST API",
             "openapi": "REST API"
         }
+        
+        # Precompile the file naming and code patterns, which are matched
+        # against every file in detect()
+        self._file_regexes = {
+            architecture: [re.compile(pattern) for pattern in patterns]
+            for architecture, patterns in self.file_patterns.items()
+        }
+        self._code_regexes = {
+            architecture: [re.compile(pattern) for pattern in patterns]
+            for architecture, patterns in self.code_patterns.items()
+        }
     
     def _apply_context_validation(self, architecture_matches, architecture_evidence, files, files_content=None):
         """
@@ -289,9 +300,9 @@ class ArchitectureDetector:
             # Check for multiple service directories
             service_dirs = set()
             for file_path in files:
-                parts = file_path.split('/')
-                if len(parts) >= 2 and (parts[0] == 'services' or parts[0] == 'microservices'):
-                    service_dirs.add(parts[1])
+                top_dir, sep, rest = file_path.partition('/')
+                if sep and (top_dir == 'services' or top_dir == 'microservices'):
+                    service_dirs.add(rest.partition('/')[0])
             
             many_services = len(service_dirs) >= 3
             
@@ -369,13 +380,14 @@ class ArchitectureDetector:
         # Step 1: Analyze directory structure
         directories = set()
         for file_path in files:
-            # Extract all directories in the path
-            path_components = file_path.split(os.sep)
-            for i in range(len(path_components)):
-                if i > 0:  # Skip the first component (which is empty or the repo root)
-                    dir_path = os.sep.join(path_components[:i])
-                    if dir_path and not dir_path.startswith("."):  # Skip hidden directories
-                        directories.add(dir_path)
+            # Extract all directories in the path by slicing at each separator
+            # rather than splitting and re-joining the components
+            sep_index = file_path.find(os.sep)
+            while sep_index != -1:
+                dir_path = file_path[:sep_index]
+                if dir_path and not dir_path.startswith("."):  # Skip hidden directories
+                    directories.add(dir_path)
+                sep_index = file_path.find(os.sep, sep_index + 1)
         
         # Check for directory pattern matches
         for architecture, pattern_sets in self.directory_patterns.items():
@@ -383,9 +395,11 @@ class ArchitectureDetector:
                 # Count how many directories from the pattern exist
                 matching_dirs = []
                 for pattern in pattern_set:
-                    matching = [d for d in directories if d.endswith(pattern) or pattern in d.split(os.sep)]
-                    if matching:
-                        matching_dirs.append((pattern, matching[0]))
+                    # Only the first matching directory is reported, so stop
+                    # scanning once one is found
+                    matching = next((d for d in directories if d.endswith(pattern) or pattern in d.split(os.sep)), None)
+                    if matching is not None:
+                        matching_dirs.append((pattern, matching))
                 
                 # If we found all patterns in the set, it's a strong match
                 if len(matching_dirs) == len(pattern_set):
@@ -404,13 +418,12 @@ class ArchitectureDetector:
                     architecture_evidence[architecture].append(f"Found some directories: {dirs_found}")
         
         # Step 2: Analyze file naming patterns
-        for architecture, patterns in self.file_patterns.items():
-            for pattern in patterns:
+        for architecture, regexes in self._file_regexes.items():
+            for regex in regexes:
                 for file_path in files:
-                    filename = os.path.basename(file_path)
-                    if re.search(pattern, file_path):
+                    if regex.search(file_path):
                         architecture_matches[architecture] += 5
-                        architecture_evidence[architecture].append(f"Found file pattern: {filename}")
+                        architecture_evidence[architecture].append(f"Found file pattern: {os.path.basename(file_path)}")
                         break  # Count each pattern only once
         
         # Step 3: Check for special framework-specific conventions that imply architectures
@@ -477,31 +490,39 @@ class ArchitectureDetector:
             architecture_evidence["Microservices"].append(f"Found {microservice_count} microservice indicators")
         
         # Step 4: Analyze directory statistics for module-based architectures
-        dir_counter = Counter()
-        for file_path in files:
-            path_parts = file_path.split(os.sep)
-            for i in range(1, min(4, len(path_parts))):  # Look at first few directory levels
-                if path_parts[i-1]:  # Skip empty parts
-                    dir_counter[path_parts[i-1]] += 1
+        # Counter consumes the generator in C. Splitting at most three times
+        # and dropping the last piece keeps the first few directory levels.
+        dir_counter = Counter(
+            dirname
+            for file_path in files
+            for dirname in file_path.split(os.sep, 3)[:-1]
+            if dirname  # Skip empty parts
+        )
         
         # Feature modules pattern: many directories at the same level with similar structure
-        potential_feature_dirs = []
-        for dirname, count in dir_counter.items():
-            # Potential feature/module directories have more than a few files
-            if count > 5 and dirname not in ["src", "app", "test", "tests", "build", "dist", "node_modules"]:
-                potential_feature_dirs.append(dirname)
+        # Potential feature/module directories have more than a few files
+        potential_feature_dirs = [
+            dirname for dirname, count in dir_counter.items()
+            if count > 5 and dirname not in {"src", "app", "test", "tests", "build", "dist", "node_modules"}
+        ]
         
         if len(potential_feature_dirs) >= 3:
             # Check if these directories have similar structure (indicating modules/features)
             similar_structure = True
+            
+            # Group file extensions by top-level path component in one pass
+            # instead of rescanning every file for each candidate directory
+            extensions_by_top_dir = defaultdict(Counter)
+            for f in files:
+                top_dir = f.partition(os.sep)[0]
+                extensions_by_top_dir[top_dir][os.path.splitext(f)[1]] += 1
+            
             # Get the structure of the first directory
             first_dir = potential_feature_dirs[0]
-            first_dir_files = [f for f in files if f.split(os.sep)[0] == first_dir]
-            first_dir_extensions = Counter([os.path.splitext(f)[1] for f in first_dir_files])
+            first_dir_extensions = extensions_by_top_dir[first_dir]
             
             for feature_dir in potential_feature_dirs[1:]:
-                dir_files = [f for f in files if f.split(os.sep)[0] == feature_dir]
-                dir_extensions = Counter([os.path.splitext(f)[1] for f in dir_files])
+                dir_extensions = extensions_by_top_dir[feature_dir]
                 
                 # Check if the extension distribution is similar
                 if not any(ext in dir_extensions for ext in first_dir_extensions):
@@ -522,13 +543,13 @@ class ArchitectureDetector:
                     continue
                 
                 # Look for code patterns in file content
-                for architecture, patterns in self.code_patterns.items():
-                    for pattern in patterns:
-                        matches = re.findall(pattern, content)
+                for architecture, regexes in self._code_regexes.items():
+                    for regex in regexes:
+                        matches = regex.findall(content)
                         if matches:
                             architecture_matches[architecture] += len(matches) * 2
                             architecture_evidence[architecture].append(
-                                f"Code pattern in {os.path.basename(file_path)}: {pattern}"
+                                f"Code pattern in {os.path.basename(file_path)}: {regex.pattern}"
                             )
         
         # Step 6: Apply additional context validation
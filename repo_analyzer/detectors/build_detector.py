@@ -8,10 +8,15 @@ other artifacts that indicate how the project is built and its dependencies mana
 
 import os
 import re
-import json
 from collections import defaultdict
 from typing import Dict, List, Any, Tuple
 
+from repo_analyzer.utils.file_utils import parse_json_content
+
+# Matches a non-comment line containing '=' (e.g. "flask==2.0.1"), letting the
+# regex engine scan requirements files instead of a Python loop over lines
+_REQUIREMENT_PIN_RE = re.compile(r"^[^\S\n]*(?![#\s])[^\n]*=", re.MULTILINE)
+
 class BuildDetector:
     """
     Detector for build systems and package managers used in a repository.
@@ -180,6 +185,31 @@ class BuildDetector:
                 r"go\s+build", r"go\s+install", r"go\s+run", r"go\s+test"
             ]
         }
+        
+        # Precompile the build system, package manager and usage patterns
+        self._build_system_regexes = {
+            system: [re.compile(pattern) for pattern in patterns]
+            for system, patterns in self.build_system_patterns.items()
+        }
+        self._package_manager_regexes = {
+            manager: [re.compile(pattern) for pattern in patterns]
+            for manager, patterns in self.package_manager_patterns.items()
+        }
+        self._usage_regexes = {
+            system: [re.compile(pattern) for pattern in patterns]
+            for system, patterns in self.usage_indicators.items()
+        }
+        
+        # File name tables as (name, exact-name set, suffix tuple) so each file
+        # is checked with one hash lookup and one endswith call per entry
+        self._build_system_file_lookup = [
+            (system, frozenset(filenames), tuple(filenames))
+            for system, filenames in self.build_system_files.items()
+        ]
+        self._package_manager_file_lookup = [
+            (manager, frozenset(filenames), tuple(filenames))
+            for manager, filenames in self.package_manager_files.items()
+        ]
     
     def _apply_context_validation(self, build_matches, package_matches, files, files_content):
         """
@@ -209,9 +239,9 @@ class BuildDetector:
         # Get first-level directories
         first_level_dirs = set()
         for file_path in files:
-            parts = file_path.split(os.sep)
-            if len(parts) > 1:
-                first_level_dirs.add(parts[0])
+            top_dir, sep, _ = file_path.partition(os.sep)
+            if sep:
+                first_level_dirs.add(top_dir)
         
         # Check if any common frontend/backend pattern exists
         for front, back in common_structures:
@@ -237,27 +267,28 @@ class BuildDetector:
             if backend_has_pip:
                 package_matches["pip"] = package_matches.get("pip", 0) + 30
         
+        # Look in shell scripts, GitHub workflows, and other CI configurations.
+        # The candidate files do not depend on the system being checked, so
+        # they are collected once rather than once per system.
+        potential_files = []
+        for file_path in files:
+            path_lower = file_path.lower()
+            if (file_path.endswith(('.sh', '.yml', '.yaml')) or 
+                '.github/workflows/' in file_path or 
+                'jenkins' in path_lower or
+                'travis' in path_lower or
+                'gitlab-ci' in path_lower or
+                'dockerfile' in path_lower):
+                potential_files.append(file_path)
+        
         # Check for actual usage of build systems and package managers
-        for system, patterns in self.usage_indicators.items():
-            # Look in shell scripts, GitHub workflows, and other CI configurations
-            potential_files = []
-            for file_path in files:
-                if (file_path.endswith('.sh') or 
-                    '.github/workflows/' in file_path or 
-                    file_path.endswith('.yml') or 
-                    file_path.endswith('.yaml') or
-                    'jenkins' in file_path.lower() or
-                    'travis' in file_path.lower() or
-                    'gitlab-ci' in file_path.lower() or
-                    'dockerfile' in file_path.lower()):
-                    potential_files.append(file_path)
-            
+        for system, regexes in self._usage_regexes.items():
             found_usage = False
             for file_path in potential_files:
                 if file_path in files_content:
                     content = files_content[file_path]
-                    for pattern in patterns:
-                        if re.search(pattern, content):
+                    for regex in regexes:
+                        if regex.search(content):
                             found_usage = True
                             if system in build_matches:
                                 build_matches[system] += 10  # Strong evidence of usage
@@ -276,7 +307,7 @@ class BuildDetector:
                 if file_path.endswith('package.json'):
                     has_package_json = True
                     try:
-                        package_data = json.loads(content)
+                        package_data = parse_json_content(content)
                         if ('dependencies' in package_data or 'devDependencies' in package_data):
                             has_dependencies = True
                     except:
@@ -296,18 +327,14 @@ class BuildDetector:
             has_valid_pip_file = False
             
             for file_path, content in files_content.items():
-                if file_path.endswith('requirements.txt') or file_path.endswith('setup.py'):
+                if file_path.endswith(('requirements.txt', 'setup.py')):
                     has_valid_pip_file = True
                     
                     # Check if requirements.txt has package names
                     if file_path.endswith('requirements.txt'):
                         # Requirements.txt should have at least one line with a package name
-                        lines = content.strip().split('\n')
-                        for line in lines:
-                            line = line.strip()
-                            if line and not line.startswith('#') and '=' in line:
-                                package_matches["pip"] = package_matches.get("pip", 0) + 10
-                                break
+                        if _REQUIREMENT_PIN_RE.search(content):
+                            package_matches["pip"] = package_matches.get("pip", 0) + 10
                     
                     # Check if setup.py has install_requires
                     elif file_path.endswith('setup.py'):
@@ -341,7 +368,7 @@ class BuildDetector:
             has_valid_gradle = False
             
             for file_path, content in files_content.items():
-                if file_path.endswith('build.gradle') or file_path.endswith('build.gradle.kts'):
+                if file_path.endswith(('build.gradle', 'build.gradle.kts')):
                     if ('repositories' in content and 
                         'dependencies' in content):
                         has_valid_gradle = True
@@ -401,26 +428,26 @@ class BuildDetector:
             filename = os.path.basename(file_path)
             
             # Check for build system files
-            for system, filenames in self.build_system_files.items():
-                if filename in filenames:
+            for system, names, suffixes in self._build_system_file_lookup:
+                if filename in names:
                     build_matches[system] += 10  # High weight for exact filename match
                     build_evidence[system].append(f"Found file: {filename}")
-                elif any(filename.endswith(f) for f in filenames):
+                elif filename.endswith(suffixes):
                     build_matches[system] += 8  # Slightly lower weight for extension match
                     build_evidence[system].append(f"Found file: {filename}")
-                elif any(pattern in file_path for pattern in filenames):
+                elif any(pattern in file_path for pattern in suffixes):
                     build_matches[system] += 5  # Lower weight for path match
                     build_evidence[system].append(f"Found pattern in path: {file_path}")
             
             # Check for package manager files
-            for manager, filenames in self.package_manager_files.items():
-                if filename in filenames:
+            for manager, names, suffixes in self._package_manager_file_lookup:
+                if filename in names:
                     package_matches[manager] += 10  # High weight for exact filename match
                     package_evidence[manager].append(f"Found file: {filename}")
-                elif any(filename.endswith(f) for f in filenames):
+                elif filename.endswith(suffixes):
                     package_matches[manager] += 8  # Slightly lower weight for extension match
                     package_evidence[manager].append(f"Found file: {filename}")
-                elif any(pattern in file_path for pattern in filenames):
+                elif any(pattern in file_path for pattern in suffixes):
                     package_matches[manager] += 5  # Lower weight for path match
                     package_evidence[manager].append(f"Found pattern in path: {file_path}")
             
@@ -441,9 +468,9 @@ class BuildDetector:
                 continue
                 
             # Check for build system patterns
-            for system, patterns in self.build_system_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
+            for system, regexes in self._build_system_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         # Weight based on number of matches
                         match_count = len(matches)
@@ -453,13 +480,13 @@ class BuildDetector:
                         if matches and len(matches[0]) > 60:  # Truncate long matches
                             match_text = matches[0][:57] + "..."
                         else:
-                            match_text = str(matches[0]) if matches else pattern
+                            match_text = str(matches[0]) if matches else regex.pattern
                         build_evidence[system].append(f"Pattern match: {match_text}")
             
             # Check for package manager patterns
-            for manager, patterns in self.package_manager_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
+            for manager, regexes in self._package_manager_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         # Weight based on number of matches
                         match_count = len(matches)
@@ -469,7 +496,7 @@ class BuildDetector:
                         if matches and len(matches[0]) > 60:  # Truncate long matches
                             match_text = matches[0][:57] + "..."
                         else:
-                            match_text = str(matches[0]) if matches else pattern
+                            match_text = str(matches[0]) if matches else regex.pattern
                         package_evidence[manager].append(f"Pattern match: {match_text}")
         
         # Step 3: Apply context validation to reduce false positives
@@ -489,7 +516,7 @@ class BuildDetector:
                 # Only include build systems with reasonable confidence
                 if confidence >= 35:
                     # Keep only unique evidence and limit to 5 examples
-                    unique_evidence = list(set(build_evidence[system]))[:5]
+                    unique_evidence = list(dict.fromkeys(build_evidence[system]))[:5]
                     
                     build_systems[system] = {
                         "matches": matches,
@@ -514,7 +541,7 @@ class BuildDetector:
                 # Only include package managers with reasonable confidence
                 if confidence >= threshold:
                     # Keep only unique evidence and limit to 5 examples
-                    unique_evidence = list(set(package_evidence[manager]))[:5]
+                    unique_evidence = list(dict.fromkeys(package_evidence[manager]))[:5]
                     
                     package_managers[manager] = {
                         "matches": matches,
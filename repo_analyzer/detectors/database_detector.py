@@ -14,6 +14,9 @@ import re
 from collections import defaultdict
 from typing import Dict, List, Any
 
+# Matches the user:password part of a connection URL so it can be obfuscated
+_URL_CREDENTIALS_RE = re.compile(r'://[^@/]+@')
+
 class DatabaseDetector:
     """
     Detector for database technologies used in a repository.
@@ -252,6 +255,35 @@ class DatabaseDetector:
                 r"new\s+AWS\.DynamoDB\(", r"DynamoDBClient\(", r"DynamoDBDocument\("
             ]
         }
+        
+        # Compiled connection calls (e.g. "mysql.connect(") per database, used
+        # by context validation to confirm a match before it is reported
+        self._connection_regexes = {
+            db: [re.compile(pattern) for pattern in patterns]
+            for db, patterns in self.connection_patterns.items()
+        }
+        
+        # Precompile the case-insensitive patterns searched in every loaded file
+        self._config_file_regexes = {
+            db: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for db, patterns in self.config_file_patterns.items()
+        }
+        self._db_url_regexes = {
+            db: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for db, patterns in self.db_url_patterns.items()
+        }
+        self._db_driver_regexes = {
+            db: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for db, patterns in self.db_driver_patterns.items()
+        }
+        self._orm_regexes = {
+            orm: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for orm, patterns in self.orm_patterns.items()
+        }
+        self._query_regexes = {
+            db_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for db_type, patterns in self.query_patterns.items()
+        }
     
     def _apply_context_validation(self, db_matches, evidence, files_content):
         """Apply context-aware validation to reduce false positives in database detection."""
@@ -260,11 +292,13 @@ class DatabaseDetector:
         for db, patterns in self.connection_patterns.items():
             if db in db_matches:
                 has_connection = False
+                regexes = self._connection_regexes[db]
                 
                 for _, content in files_content.items():
-                    if any(re.search(pattern, content) for pattern in patterns):
+                    if any(regex.search(content) for regex in regexes):
                         has_connection = True
-                        evidence[db].append(f"Found database connection: {re.search(patterns[0], content).group() if re.search(patterns[0], content) else patterns[0]}")
+                        first_match = regexes[0].search(content)
+                        evidence[db].append(f"Found database connection: {first_match.group() if first_match else patterns[0]}")
                         break
                 
                 if not has_connection:
@@ -272,28 +306,30 @@ class DatabaseDetector:
                     db_matches[db] = db_matches[db] // 2
         
         # Check for environment variables in docker/docker-compose files
-        # which strongly indicate a database is being used
+        # which strongly indicate a database is being used. The markers here
+        # and in the dependency checks below are plain literals, so substring
+        # tests are used rather than regex searches.
         docker_files = [f for f in files_content.keys() if 'dockerfile' in f.lower() or 'docker-compose' in f.lower()]
         for file_path in docker_files:
             content = files_content[file_path]
             
             # Check for MySQL environment variables
-            if re.search(r"MYSQL_ROOT_PASSWORD|MYSQL_DATABASE|MYSQL_USER|MYSQL_PASSWORD", content):
+            if any(marker in content for marker in ("MYSQL_ROOT_PASSWORD", "MYSQL_DATABASE", "MYSQL_USER", "MYSQL_PASSWORD")):
                 db_matches["MySQL"] = db_matches.get("MySQL", 0) + 15
                 evidence["MySQL"].append(f"Found MySQL environment variables in {os.path.basename(file_path)}")
             
             # Check for PostgreSQL environment variables
-            if re.search(r"POSTGRES_PASSWORD|POSTGRES_USER|POSTGRES_DB|PGDATA", content):
+            if any(marker in content for marker in ("POSTGRES_PASSWORD", "POSTGRES_USER", "POSTGRES_DB", "PGDATA")):
                 db_matches["PostgreSQL"] = db_matches.get("PostgreSQL", 0) + 15
                 evidence["PostgreSQL"].append(f"Found PostgreSQL environment variables in {os.path.basename(file_path)}")
             
             # Check for MongoDB environment variables
-            if re.search(r"MONGO_INITDB_ROOT_USERNAME|MONGO_INITDB_ROOT_PASSWORD|MONGO_INITDB_DATABASE", content):
+            if any(marker in content for marker in ("MONGO_INITDB_ROOT_USERNAME", "MONGO_INITDB_ROOT_PASSWORD", "MONGO_INITDB_DATABASE")):
                 db_matches["MongoDB"] = db_matches.get("MongoDB", 0) + 15
                 evidence["MongoDB"].append(f"Found MongoDB environment variables in {os.path.basename(file_path)}")
             
             # Check for Redis environment variables
-            if re.search(r"REDIS_PASSWORD|REDIS_PORT|REDIS_HOST", content):
+            if any(marker in content for marker in ("REDIS_PASSWORD", "REDIS_PORT", "REDIS_HOST")):
                 db_matches["Redis"] = db_matches.get("Redis", 0) + 15
                 evidence["Redis"].append(f"Found Redis environment variables in {os.path.basename(file_path)}")
         
@@ -303,57 +339,57 @@ class DatabaseDetector:
                 content = files_content[file_path]
                 
                 # Check for MySQL packages
-                if re.search(r'"mysql"|"mysql2"', content):
+                if any(marker in content for marker in ('"mysql"', '"mysql2"')):
                     db_matches["MySQL"] = db_matches.get("MySQL", 0) + 10
                     evidence["MySQL"].append(f"Found MySQL dependency in package.json")
                 
                 # Check for PostgreSQL packages
-                if re.search(r'"pg"|"postgres"', content):
+                if any(marker in content for marker in ('"pg"', '"postgres"')):
                     db_matches["PostgreSQL"] = db_matches.get("PostgreSQL", 0) + 10
                     evidence["PostgreSQL"].append(f"Found PostgreSQL dependency in package.json")
                 
                 # Check for MongoDB packages
-                if re.search(r'"mongodb"|"mongoose"', content):
+                if any(marker in content for marker in ('"mongodb"', '"mongoose"')):
                     db_matches["MongoDB"] = db_matches.get("MongoDB", 0) + 10
                     evidence["MongoDB"].append(f"Found MongoDB dependency in package.json")
                 
                 # Check for Redis packages
-                if re.search(r'"redis"', content):
+                if '"redis"' in content:
                     db_matches["Redis"] = db_matches.get("Redis", 0) + 10
                     evidence["Redis"].append(f"Found Redis dependency in package.json")
                 
                 # Check for Elasticsearch packages
-                if re.search(r'"elasticsearch"|"@elastic/elasticsearch"', content):
+                if any(marker in content for marker in ('"elasticsearch"', '"@elastic/elasticsearch"')):
                     db_matches["Elasticsearch"] = db_matches.get("Elasticsearch", 0) + 10
                     evidence["Elasticsearch"].append(f"Found Elasticsearch dependency in package.json")
         
         # Check for requirements.txt or Pipfile for Python projects
         for file_path in files_content.keys():
-            if file_path.endswith('requirements.txt') or file_path.endswith('Pipfile'):
+            if file_path.endswith(('requirements.txt', 'Pipfile')):
                 content = files_content[file_path]
                 
                 # Check for MySQL packages
-                if re.search(r'mysql-connector|pymysql', content):
+                if any(marker in content for marker in ('mysql-connector', 'pymysql')):
                     db_matches["MySQL"] = db_matches.get("MySQL", 0) + 10
                     evidence["MySQL"].append(f"Found MySQL dependency in {os.path.basename(file_path)}")
                 
                 # Check for PostgreSQL packages
-                if re.search(r'psycopg2|psycopg2-binary', content):
+                if any(marker in content for marker in ('psycopg2', 'psycopg2-binary')):
                     db_matches["PostgreSQL"] = db_matches.get("PostgreSQL", 0) + 10
                     evidence["PostgreSQL"].append(f"Found PostgreSQL dependency in {os.path.basename(file_path)}")
                 
                 # Check for MongoDB packages
-                if re.search(r'pymongo|mongoengine', content):
+                if any(marker in content for marker in ('pymongo', 'mongoengine')):
                     db_matches["MongoDB"] = db_matches.get("MongoDB", 0) + 10
                     evidence["MongoDB"].append(f"Found MongoDB dependency in {os.path.basename(file_path)}")
                 
                 # Check for Redis packages
-                if re.search(r'redis', content):
+                if 'redis' in content:
                     db_matches["Redis"] = db_matches.get("Redis", 0) + 10
                     evidence["Redis"].append(f"Found Redis dependency in {os.path.basename(file_path)}")
                 
                 # Check for Elasticsearch packages
-                if re.search(r'elasticsearch', content):
+                if 'elasticsearch' in content:
                     db_matches["Elasticsearch"] = db_matches.get("Elasticsearch", 0) + 10
                     evidence["Elasticsearch"].append(f"Found Elasticsearch dependency in {os.path.basename(file_path)}")
         
@@ -391,9 +427,9 @@ class DatabaseDetector:
             filename = os.path.basename(file_path)
             
             # Check for configuration files
-            for db, config_patterns in self.config_file_patterns.items():
-                for pattern in config_patterns:
-                    if re.search(pattern, filename, re.IGNORECASE):
+            for db, regexes in self._config_file_regexes.items():
+                for regex in regexes:
+                    if regex.search(filename):
                         db_matches[db] += 20  # High weight for config files
                         evidence[db].append(f"Config file: {filename}")
             
@@ -402,9 +438,9 @@ class DatabaseDetector:
                 continue
             
             # Check for database URLs and connection strings
-            for db, url_patterns in self.db_url_patterns.items():
-                for pattern in url_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
+            for db, regexes in self._db_url_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         # Add weight based on number of matches
                         db_matches[db] += len(matches) * 10
@@ -413,42 +449,47 @@ class DatabaseDetector:
                         if len(match_text) > 60:  # Truncate long matches
                             match_text = match_text[:57] + "..."
                         # Obfuscate potential credentials
-                        obfuscated = re.sub(r'://[^@/]+@', '://***@', match_text)
+                        obfuscated = _URL_CREDENTIALS_RE.sub('://***@', match_text)
                         evidence[db].append(f"Connection string: {obfuscated}")
             
             # Check for database driver imports
-            for db, driver_patterns in self.db_driver_patterns.items():
-                for pattern in driver_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
+            for db, regexes in self._db_driver_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         db_matches[db] += len(matches) * 8
                         evidence[db].append(f"Driver: {matches[0]}")
             
-            # Check for ORM patterns
-            for orm, orm_patterns in self.orm_patterns.items():
-                for pattern in orm_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
+            # Check for ORM patterns. The lowercased content used to pick the
+            # database behind an ORM is computed on the first ORM match only.
+            content_lower = None
+            for orm, regexes in self._orm_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
+                        if content_lower is None:
+                            content_lower = content.lower()
+                        
                         # Extract the database name from the ORM name
                         if "SQLAlchemy" in orm:
                             # SQLAlchemy could be used with multiple databases
                             # Check for specific database engines
-                            if "mysql" in content.lower():
+                            if "mysql" in content_lower:
                                 db_matches["MySQL"] += len(matches) * 5
                                 evidence["MySQL"].append(f"ORM ({orm}): {matches[0]}")
-                            if "postgres" in content.lower():
+                            if "postgres" in content_lower:
                                 db_matches["PostgreSQL"] += len(matches) * 5
                                 evidence["PostgreSQL"].append(f"ORM ({orm}): {matches[0]}")
-                            if "sqlite" in content.lower():
+                            if "sqlite" in content_lower:
                                 db_matches["SQLite"] += len(matches) * 5
                                 evidence["SQLite"].append(f"ORM ({orm}): {matches[0]}")
                         elif "Django ORM" in orm:
                             # Django ORM defaults to SQLite but can use others
                             # Look for database settings
-                            if "postgresql" in content.lower() or "psycopg2" in content.lower():
+                            if "postgresql" in content_lower or "psycopg2" in content_lower:
                                 db_matches["PostgreSQL"] += len(matches) * 5
                                 evidence["PostgreSQL"].append(f"ORM ({orm}): {matches[0]}")
-                            elif "mysql" in content.lower():
+                            elif "mysql" in content_lower:
                                 db_matches["MySQL"] += len(matches) * 5
                                 evidence["MySQL"].append(f"ORM ({orm}): {matches[0]}")
                             else:
@@ -459,7 +500,7 @@ class DatabaseDetector:
                             evidence["MongoDB"].append(f"ORM ({orm}): {matches[0]}")
                         elif "Sequelize" in orm or "Prisma" in orm:
                             # Check for specific database configuration
-                            if "postgres" in content.lower():
+                            if "postgres" in content_lower:
                                 db_matches["PostgreSQL"] += len(matches) * 5
                                 evidence["PostgreSQL"].append(f"ORM ({orm}): {matches[0]}")
                             else:
@@ -480,9 +521,9 @@ class DatabaseDetector:
                             evidence["PostgreSQL"].append(f"ORM ({orm}): {matches[0]}")
             
             # Check for query syntax patterns
-            for db_type, query_patterns in self.query_patterns.items():
-                for pattern in query_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
+            for db_type, regexes in self._query_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         # Map query syntax to database types
                         if db_type == "SQL":
@@ -525,7 +566,7 @@ class DatabaseDetector:
                 # Increased threshold from 15 to 35 to reduce false positives
                 if confidence >= 35:
                     # Keep only unique evidence and limit to 5 examples
-                    unique_evidence = list(set(evidence[db]))[:5]
+                    unique_evidence = list(dict.fromkeys(evidence[db]))[:5]
                     
                     databases[db] = {
                         "matches": matches,
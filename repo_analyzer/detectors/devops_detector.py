@@ -15,6 +15,13 @@ import re
 from collections import defaultdict
 from typing import Dict, List, Any
 
+# Structural patterns used to confirm Helm charts and Packer templates
+_HELM_CHART_API_RE = re.compile(r"apiVersion:.*helm", re.IGNORECASE)
+_PACKER_STRUCTURE_REGEXES = tuple(re.compile(pattern) for pattern in (
+    r"\"builders\":\s*\[", r"\"provisioners\":\s*\[",
+    r"source\s+\".*\"\s+\".*\"\s+{", r"build\s+{"
+))
+
 class DevOpsDetector:
     """
     Detector for DevOps tools and practices used in a repository.
@@ -296,6 +303,13 @@ class DevOpsDetector:
                 r"on:\s+pull_request", r"workflow_dispatch", r"build:", r"test:", r"deploy:"
             ]
         }
+        
+        # Compiled DevOps patterns, counted with findall() in each loaded file
+        # under 500KB during step 2 of detect()
+        self._devops_regexes = {
+            tech: [re.compile(pattern) for pattern in patterns]
+            for tech, patterns in self.devops_patterns.items()
+        }
     
     # NEW METHOD: Validate DevOps matches to reduce false positives
     def _validate_devops_matches(self, devops_matches, files, files_content):
@@ -308,13 +322,13 @@ class DevOpsDetector:
             has_helm_structure = False
             
             for file_path, content in files_content.items():
-                if file_path.endswith("Chart.yaml") or file_path.endswith("Chart.yml"):
-                    if re.search(r"apiVersion:.*helm", content, re.IGNORECASE):
+                if file_path.endswith(("Chart.yaml", "Chart.yml")):
+                    if _HELM_CHART_API_RE.search(content):
                         has_chart_yaml = True
                     
             # Check for templates directory structure
             has_templates_dir = any("templates/" in file for file in files)
-            has_values_yaml = any(file.endswith("values.yaml") or file.endswith("values.yml") for file in files)
+            has_values_yaml = any(file.endswith(("values.yaml", "values.yml")) for file in files)
             
             has_helm_structure = has_chart_yaml or (has_templates_dir and has_values_yaml)
             
@@ -325,14 +339,9 @@ class DevOpsDetector:
         # Validate Packer detection
         if "Packer" in devops_matches:
             # Packer requires specific JSON or HCL structure
-            packer_patterns = [
-                r"\"builders\":\s*\[", r"\"provisioners\":\s*\[",
-                r"source\s+\".*\"\s+\".*\"\s+{", r"build\s+{"
-            ]
-            
             has_packer_structure = False
             for _, content in files_content.items():
-                if any(re.search(pattern, content) for pattern in packer_patterns):
+                if any(regex.search(content) for regex in _PACKER_STRUCTURE_REGEXES):
                     has_packer_structure = True
                     break
             
@@ -461,9 +470,9 @@ class DevOpsDetector:
                 continue
             
             # Check for DevOps patterns in content
-            for tech, patterns in self.devops_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
+            for tech, regexes in self._devops_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         match_count = len(matches)
                         if match_count > 10:
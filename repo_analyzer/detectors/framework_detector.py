@@ -11,6 +11,10 @@ import re
 from collections import defaultdict
 from typing import Dict, List, Any, Tuple
 
+# JSX/TSX files and hooks/components that confirm a React match
+_REACT_FILE_REGEXES = (re.compile(r"\.jsx$"), re.compile(r"\.tsx$"))
+_REACT_CODE_REGEXES = tuple(re.compile(pattern) for pattern in (r"useState", r"useEffect", r"React\.Component"))
+
 class FrameworkDetector:
     """
     Detector for frameworks used in a repository.
@@ -283,6 +287,13 @@ class FrameworkDetector:
                 r"class\s+\w+\(nn\.Module\)"
             ]
         }
+        
+        # Compiled strong evidence patterns per framework; a framework without
+        # a hit in any loaded file has its confidence cut in validation
+        self._strong_evidence_regexes = {
+            framework: [re.compile(pattern) for pattern in patterns]
+            for framework, patterns in self.strong_evidence_patterns.items()
+        }
     
     def _apply_context_validation(self, framework_matches, files_content):
         """Apply context-aware validation to reduce false positives in framework detection."""
@@ -305,7 +316,7 @@ class FrameworkDetector:
         # Count files by language
         language_counts = defaultdict(int)
         for file_path in files_content.keys():
-            ext = file_path.split('.')[-1].lower()
+            ext = file_path.rsplit('.', 1)[-1].lower()
             if ext in language_extensions:
                 language_counts[language_extensions[ext]] += 1
         
@@ -365,12 +376,12 @@ class FrameworkDetector:
                     framework_matches[framework] = framework_matches[framework] // 5
         
         # Check for strong evidence patterns
-        for framework, patterns in self.strong_evidence_patterns.items():
+        for framework, regexes in self._strong_evidence_regexes.items():
             if framework in framework_matches:
                 has_strong_evidence = False
                 
                 for _, content in files_content.items():
-                    if any(re.search(pattern, content) for pattern in patterns):
+                    if any(regex.search(content) for regex in regexes):
                         has_strong_evidence = True
                         break
                 
@@ -388,11 +399,10 @@ class FrameworkDetector:
         
         # Special case for React: check for JSX/TSX or React hooks
         if "React" in framework_matches:
-            react_patterns = [r"\.jsx$", r"\.tsx$", r"useState", r"useEffect", r"React\.Component"]
             found_react_patterns = False
             for file_path, content in files_content.items():
-                if any(re.search(pattern, file_path) for pattern in react_patterns[:2]) or \
-                   any(re.search(pattern, content) for pattern in react_patterns[2:]):
+                if any(regex.search(file_path) for regex in _REACT_FILE_REGEXES) or \
+                   any(regex.search(content) for regex in _REACT_CODE_REGEXES):
                     found_react_patterns = True
                     break
             if not found_react_patterns:
@@ -436,11 +446,15 @@ class FrameworkDetector:
         framework_matches = defaultdict(int)
         framework_evidence = defaultdict(list)
         
+        # Bind the pattern table once instead of looking it up on the
+        # instance for every file
+        framework_patterns = list(self.framework_patterns.items())
+        
         # Step 1: Check file paths for framework-specific files and directories
         for file_path in files:
             filename = os.path.basename(file_path)
             
-            for framework, patterns in self.framework_patterns.items():
+            for framework, patterns in framework_patterns:
                 for pattern in patterns:
                     # Check if pattern is in filename (exact match)
                     if pattern == filename:
@@ -471,9 +485,10 @@ class FrameworkDetector:
                     "Celery": ["celery"]
                 }
                 
+                content_lower = content.lower()
                 for framework, patterns in python_frameworks.items():
                     for pattern in patterns:
-                        if pattern in content.lower():
+                        if pattern in content_lower:
                             framework_matches[framework] += 15  # High weight for dependency
                             framework_evidence[framework].append(f"Found pattern: {pattern} in {filename}")
             
@@ -496,35 +511,34 @@ class FrameworkDetector:
                             framework_evidence[framework].append(f"Found dependency: {pattern} in {filename}")
         
         # Step 3: Check file content for framework patterns
+        # Skip very short patterns (< 4 chars) for content search to reduce false positives;
+        # they are filtered once here rather than for every file
+        content_patterns = [
+            (framework, [pattern for pattern in patterns if len(pattern) >= 4])
+            for framework, patterns in framework_patterns
+        ]
         for file_path, content in files_content.items():
             # Skip checking large files for performance reasons
             if len(content) > 500000:  # Skip files larger than 500KB
                 continue
                 
-            # Extract file extension
-            _, ext = os.path.splitext(file_path)
-            ext = ext.lower()
+            # Used by both the import and the plain match evidence below
+            filename = os.path.basename(file_path)
             
-            for framework, patterns in self.framework_patterns.items():
+            for framework, patterns in content_patterns:
                 for pattern in patterns:
-                    # Skip very short patterns (< 4 chars) for content search to reduce false positives
-                    if len(pattern) < 4:
-                        continue
-                        
-                    # Check if pattern is in file content
-                    if pattern in content:
-                        # Count multiple occurrences
-                        occurrences = content.count(pattern)
-                        
+                    # Count occurrences of the pattern in the file content
+                    occurrences = content.count(pattern)
+                    if occurrences:
                         # Additional weight for patterns that look like imports or includes
                         if (("import " + pattern) in content or 
                             ("require(" + pattern) in content or 
                             ("include " + pattern) in content):
                             framework_matches[framework] += occurrences * 2
-                            framework_evidence[framework].append(f"Found import: {pattern} in {os.path.basename(file_path)}")
+                            framework_evidence[framework].append(f"Found import: {pattern} in {filename}")
                         else:
                             framework_matches[framework] += occurrences
-                            framework_evidence[framework].append(f"Found pattern: {pattern} in {os.path.basename(file_path)}")
+                            framework_evidence[framework].append(f"Found pattern: {pattern} in {filename}")
         
         # Step 4: Apply context validation to reduce false positives
         self._apply_context_validation(framework_matches, files_content)
@@ -11,6 +11,23 @@ import re
 from collections import defaultdict
 from typing import Dict, List, Any
 
+from repo_analyzer.utils.file_utils import parse_json_content
+
+# Patterns used by context validation to tell Django templates from Angular
+# and to confirm Tailwind usage
+_DJANGO_TEMPLATE_REGEXES = tuple(re.compile(pattern) for pattern in (
+    r"{%\s+.+\s+%}", r"{{\s+.+\s+}}", r"{% extends", r"{% block", r"{% include",
+    r"from django\.template", r"from django\.shortcuts import render"
+))
+_ANGULAR_SPECIFIC_REGEXES = tuple(re.compile(pattern) for pattern in (
+    r"@angular/core", r"@Component\(\{", r"@NgModule\(\{", 
+    r"platformBrowserDynamic\(\)", r"Angular\.(module|bootstrap)"
+))
+_TAILWIND_SPECIFIC_REGEXES = tuple(re.compile(pattern) for pattern in (
+    r"tailwind\.config\.js", r"@tailwind\s+base", r"@tailwind\s+components", 
+    r"@tailwind\s+utilities", r"require\(['\"]tailwindcss['\"]"
+))
+
 class FrontendDetector:
     """
     Detector for frontend technologies used in a repository.
@@ -108,6 +125,46 @@ class FrontendDetector:
             "Vitest": ["vitest.config.js", "vitest.config.ts", "import { test } from 'vitest'"],
         }
         
+        # package.json dependency names mapped to the technology they indicate
+        self.framework_packages = {
+            "react": "React", "vue": "Vue.js", "@angular/core": "Angular",
+            "svelte": "Svelte", "next": "Next.js", "nuxt": "Nuxt.js", "gatsby": "Gatsby",
+        }
+        self.css_framework_packages = {
+            "bootstrap": "Bootstrap", "tailwindcss": "Tailwind CSS",
+        }
+        self.component_library_packages = {
+            "@material-ui/core": "Material UI", "@mui/material": "Material UI",
+            "@chakra-ui/react": "Chakra UI", "antd": "Ant Design",
+            "react-bootstrap": "React Bootstrap", "@blueprintjs/core": "Blueprint",
+            "@mantine/core": "Mantine", "@headlessui/react": "Headless UI",
+            "@radix-ui/react-dialog": "Radix UI", "primereact": "PrimeReact",
+            "vuetify": "Vuetify", "quasar": "Quasar",
+        }
+        self.state_management_packages = {
+            "redux": "Redux", "react-redux": "Redux", "@reduxjs/toolkit": "Redux",
+            "mobx": "MobX", "mobx-react": "MobX", "vuex": "Vuex", "pinia": "Pinia",
+            "recoil": "Recoil", "jotai": "Jotai", "zustand": "Zustand", "xstate": "XState",
+            "@ngrx/store": "NgRx", "rxjs": "RxJS", "@apollo/client": "Apollo Client",
+            "swr": "SWR", "react-query": "React Query",
+        }
+        self.testing_library_packages = {
+            "jest": "Jest", "@testing-library/react": "Testing Library",
+            "@testing-library/vue": "Testing Library", "cypress": "Cypress",
+            "playwright": "Playwright", "selenium-webdriver": "Selenium",
+            "@storybook/react": "Storybook", "@storybook/vue": "Storybook",
+            "vitest": "Vitest",
+        }
+        
+        # Package tables paired with the category recorded for their matches
+        self._package_categories = [
+            (self.framework_packages, "framework"),
+            (self.css_framework_packages, "css"),
+            (self.component_library_packages, "component_library"),
+            (self.state_management_packages, "state_management"),
+            (self.testing_library_packages, "testing"),
+        ]
+        
         # Code patterns for frontend technologies
         self.frontend_patterns = {
             # Framework patterns
@@ -155,35 +212,37 @@ class FrontendDetector:
                 r"from\s+['\"]@material-ui/core['\"]", r"makeStyles", r"createTheme"
             ],
         }
+        
+        # Compiled frontend patterns, run against every loaded file alongside
+        # the package.json dependency tables above
+        self._frontend_regexes = {
+            tech: [re.compile(pattern) for pattern in patterns]
+            for tech, patterns in self.frontend_patterns.items()
+        }
     
     # NEW METHOD: Context validation to reduce false positives
     def _apply_context_validation(self, frontend_matches, files_content):
         """
         Apply context-aware validation to reduce false positives.
         """
-        # Check for Django template patterns which might be confused with Angular
-        django_patterns = [
-            r"{%\s+.+\s+%}", r"{{\s+.+\s+}}", r"{% extends", r"{% block", r"{% include",
-            r"from django\.template", r"from django\.shortcuts import render"
-        ]
-        
+        # Check for Django template patterns which might be confused with Angular.
+        # This only matters when Angular was matched, and every Django pattern
+        # contains "{%", "{{" or "from django", so files without any of these
+        # markers are skipped without running the regexes
         has_django_templates = False
-        for _, content in files_content.items():
-            if any(re.search(pattern, content) for pattern in django_patterns):
-                has_django_templates = True
-                break
+        if "Angular" in frontend_matches:
+            for _, content in files_content.items():
+                if ("{%" in content or "{{" in content or "from django" in content) and \
+                   any(regex.search(content) for regex in _DJANGO_TEMPLATE_REGEXES):
+                    has_django_templates = True
+                    break
         
         # If Django templates are found, reduce confidence in Angular
         if has_django_templates and "Angular" in frontend_matches:
             # Check if there are actual Angular-specific patterns
-            angular_specific = [
-                r"@angular/core", r"@Component\(\{", r"@NgModule\(\{", 
-                r"platformBrowserDynamic\(\)", r"Angular\.(module|bootstrap)"
-            ]
-            
             has_specific_angular = False
             for _, content in files_content.items():
-                if any(re.search(pattern, content) for pattern in angular_specific):
+                if any(regex.search(content) for regex in _ANGULAR_SPECIFIC_REGEXES):
                     has_specific_angular = True
                     break
             
@@ -193,14 +252,9 @@ class FrontendDetector:
         
         # Make Tailwind CSS detection more specific
         if "Tailwind CSS" in frontend_matches:
-            tailwind_specific_patterns = [
-                r"tailwind\.config\.js", r"@tailwind\s+base", r"@tailwind\s+components", 
-                r"@tailwind\s+utilities", r"require\(['\"]tailwindcss['\"]"
-            ]
-            
             has_specific_tailwind = False
             for file_path, content in files_content.items():
-                if "tailwind.config.js" in file_path or any(re.search(pattern, content) for pattern in tailwind_specific_patterns):
+                if "tailwind.config.js" in file_path or any(regex.search(content) for regex in _TAILWIND_SPECIFIC_REGEXES):
                     has_specific_tailwind = True
                     break
             
@@ -321,180 +375,29 @@ class FrontendDetector:
             if os.path.basename(file_path) == "package.json":
                 # Try to parse as JSON and extract dependencies
                 try:
-                    import json
-                    package_data = json.loads(content)
+                    package_data = parse_json_content(content)
                     
                     # Check dependencies and devDependencies
                     for dep_type in ["dependencies", "devDependencies"]:
                         if dep_type in package_data and isinstance(package_data[dep_type], dict):
                             deps = package_data[dep_type]
                             
-                            # Framework dependencies
-                            if "react" in deps:
-                                frontend_matches["React"] += 15
-                                frontend_categories["React"] = "framework"
-                                frontend_evidence["React"].append(f"Found in {dep_type}: react")
-                            
-                            if "vue" in deps:
-                                frontend_matches["Vue.js"] += 15
-                                frontend_categories["Vue.js"] = "framework"
-                                frontend_evidence["Vue.js"].append(f"Found in {dep_type}: vue")
-                            
-                            if "@angular/core" in deps:
-                                frontend_matches["Angular"] += 15
-                                frontend_categories["Angular"] = "framework"
-                                frontend_evidence["Angular"].append(f"Found in {dep_type}: @angular/core")
-                            
-                            if "svelte" in deps:
-                                frontend_matches["Svelte"] += 15
-                                frontend_categories["Svelte"] = "framework"
-                                frontend_evidence["Svelte"].append(f"Found in {dep_type}: svelte")
-                            
-                            # Next.js, Nuxt.js, Gatsby
-                            if "next" in deps:
-                                frontend_matches["Next.js"] += 15
-                                frontend_categories["Next.js"] = "framework"
-                                frontend_evidence["Next.js"].append(f"Found in {dep_type}: next")
-                            
-                            if "nuxt" in deps:
-                                frontend_matches["Nuxt.js"] += 15
-                                frontend_categories["Nuxt.js"] = "framework"
-                                frontend_evidence["Nuxt.js"].append(f"Found in {dep_type}: nuxt")
-                            
-                            if "gatsby" in deps:
-                                frontend_matches["Gatsby"] += 15
-                                frontend_categories["Gatsby"] = "framework"
-                                frontend_evidence["Gatsby"].append(f"Found in {dep_type}: gatsby")
-                            
-                            # CSS frameworks
-                            if "bootstrap" in deps:
-                                frontend_matches["Bootstrap"] += 15
-                                frontend_categories["Bootstrap"] = "css"
-                                frontend_evidence["Bootstrap"].append(f"Found in {dep_type}: bootstrap")
-                            
-                            if "tailwindcss" in deps:
-                                frontend_matches["Tailwind CSS"] += 15
-                                frontend_categories["Tailwind CSS"] = "css"
-                                frontend_evidence["Tailwind CSS"].append(f"Found in {dep_type}: tailwindcss")
-                            
-                            # Check for common UI libraries
-                            for lib in [
-                                "@material-ui/core", "@mui/material", "@chakra-ui/react",
-                                "antd", "react-bootstrap", "@blueprintjs/core",
-                                "@mantine/core", "@headlessui/react", "@radix-ui/react-dialog",
-                                "primereact", "vuetify", "quasar"
-                            ]:
-                                if lib in deps:
-                                    # Extract library name
-                                    if lib.startswith("@material-ui") or lib.startswith("@mui"):
-                                        name = "Material UI"
-                                    elif lib.startswith("@chakra-ui"):
-                                        name = "Chakra UI"
-                                    elif lib == "antd":
-                                        name = "Ant Design"
-                                    elif lib == "react-bootstrap":
-                                        name = "React Bootstrap"
-                                    elif lib.startswith("@blueprintjs"):
-                                        name = "Blueprint"
-                                    elif lib.startswith("@mantine"):
-                                        name = "Mantine"
-                                    elif lib.startswith("@headlessui"):
-                                        name = "Headless UI"
-                                    elif lib.startswith("@radix-ui"):
-                                        name = "Radix UI"
-                                    elif lib == "primereact":
-                                        name = "PrimeReact"
-                                    elif lib == "vuetify":
-                                        name = "Vuetify"
-                                    elif lib == "quasar":
-                                        name = "Quasar"
-                                    else:
-                                        name = lib
-                                    
-                                    frontend_matches[name] += 15
-                                    frontend_categories[name] = "component_library"
-                                    frontend_evidence[name].append(f"Found in {dep_type}: {lib}")
-                            
-                            # Check for state management libraries
-                            for lib in [
-                                "redux", "react-redux", "@reduxjs/toolkit",
-                                "mobx", "mobx-react", "vuex", "pinia",
-                                "recoil", "jotai", "zustand", "xstate",
-                                "@ngrx/store", "rxjs", "@apollo/client",
-                                "swr", "react-query"
-                            ]:
-                                if lib in deps:
-                                    # Extract library name
-                                    if lib.startswith("redux") or lib.startswith("@reduxjs") or lib == "react-redux":
-                                        name = "Redux"
-                                    elif lib.startswith("mobx"):
-                                        name = "MobX"
-                                    elif lib == "vuex":
-                                        name = "Vuex"
-                                    elif lib == "pinia":
-                                        name = "Pinia"
-                                    elif lib == "recoil":
-                                        name = "Recoil"
-                                    elif lib == "jotai":
-                                        name = "Jotai"
-                                    elif lib == "zustand":
-                                        name = "Zustand"
-                                    elif lib == "xstate":
-                                        name = "XState"
-                                    elif lib.startswith("@ngrx"):
-                                        name = "NgRx"
-                                    elif lib == "rxjs":
-                                        name = "RxJS"
-                                    elif lib.startswith("@apollo"):
-                                        name = "Apollo Client"
-                                    elif lib == "swr":
-                                        name = "SWR"
-                                    elif lib == "react-query":
-                                        name = "React Query"
-                                    else:
-                                        name = lib
-                                    
-                                    frontend_matches[name] += 15
-                                    frontend_categories[name] = "state_management"
-                                    frontend_evidence[name].append(f"Found in {dep_type}: {lib}")
-                            
-                            # Check for testing libraries
-                            for lib in [
-                                "jest", "@testing-library/react", "@testing-library/vue",
-                                "cypress", "playwright", "selenium-webdriver",
-                                "@storybook/react", "@storybook/vue", "vitest"
-                            ]:
-                                if lib in deps:
-                                    # Extract library name
-                                    if lib == "jest":
-                                        name = "Jest"
-                                    elif lib.startswith("@testing-library"):
-                                        name = "Testing Library"
-                                    elif lib == "cypress":
-                                        name = "Cypress"
-                                    elif lib == "playwright":
-                                        name = "Playwright"
-                                    elif lib == "selenium-webdriver":
-                                        name = "Selenium"
-                                    elif lib.startswith("@storybook"):
-                                        name = "Storybook"
-                                    elif lib == "vitest":
-                                        name = "Vitest"
-                                    else:
-                                        name = lib
-                                    
-                                    frontend_matches[name] += 15
-                                    frontend_categories[name] = "testing"
-                                    frontend_evidence[name].append(f"Found in {dep_type}: {lib}")
+                            # Framework, CSS, component, state management and testing libraries
+                            for packages, category in self._package_categories:
+                                for lib, name in packages.items():
+                                    if lib in deps:
+                                        frontend_matches[name] += 15
+                                        frontend_categories[name] = category
+                                        frontend_evidence[name].append(f"Found in {dep_type}: {lib}")
                             
                 except Exception as e:
                     # If we can't parse package.json, just continue
                     pass
             
             # Check for content patterns
-            for tech, patterns in self.frontend_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
+            for tech, regexes in self._frontend_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         match_count = len(matches)
                         if match_count > 10:
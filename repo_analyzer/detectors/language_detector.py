@@ -141,6 +141,11 @@ class LanguageDetector:
             "Makefile": "Make",
             "pubspec.yaml": "Dart",
         }
+        
+        # Lowercased extension index so detect() needs a single lookup per file
+        self._extension_index = {
+            ext.lower(): language for ext, language in self.language_extensions.items()
+        }
     
     def detect(self, files: List[str]) -> Dict[str, Dict[str, Any]]:
         """
@@ -161,21 +166,20 @@ class LanguageDetector:
         """
         # Count language occurrences based on file extensions
         language_counts = Counter()
+        special_files = self.special_files
+        extension_index = self._extension_index
         
         for file_path in files:
             # Check for special files
             filename = os.path.basename(file_path)
-            if filename in self.special_files:
-                language = self.special_files[filename]
+            language = special_files.get(filename)
+            if language is not None:
                 language_counts[language] += 3  # Give higher weight to special files
                 continue
             
-            # Check file extension
-            _, ext = os.path.splitext(file_path)
-            ext = ext.lower()  # Normalize extension
-            
-            if ext in self.language_extensions:
-                language = self.language_extensions[ext]
+            # Check file extension (split the bare filename, not the full path)
+            language = extension_index.get(os.path.splitext(filename)[1].lower())
+            if language is not None:
                 language_counts[language] += 1
         
         # Calculate confidence scores based on frequency
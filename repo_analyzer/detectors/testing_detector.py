@@ -11,6 +11,26 @@ import re
 from collections import defaultdict
 from typing import Dict, List, Any
 
+from repo_analyzer.utils.file_utils import parse_json_content
+
+# Library-specific usage patterns used to confirm weak testing framework matches
+_RTL_SPECIFIC_REGEXES = tuple(re.compile(pattern) for pattern in (
+    r"from\s+['\"]\@testing-library\/react['\"]", 
+    r"import\s+.*\s+from\s+['\"]\@testing-library\/react['\"]",
+    r"render\(\s*<.*\/>\s*\)", r"screen\.getByText"
+))
+_ENZYME_SPECIFIC_REGEXES = tuple(re.compile(pattern) for pattern in (
+    r"from\s+['\"]enzyme['\"]", 
+    r"import\s+.*\s+from\s+['\"]enzyme['\"]",
+    r"shallow\(\s*<.*\/>\s*\)", r"mount\(\s*<.*\/>\s*\)"
+))
+_RSPEC_SPECIFIC_REGEXES = tuple(re.compile(pattern) for pattern in (
+    r"require\s+['\"]rspec['\"]", 
+    r"RSpec\.describe", 
+    r"describe\s+.*\s+do\s+", 
+    r"it\s+['\"].*['\"]\s+do"
+))
+
 class TestingDetector:
     """
     Detector for testing frameworks and patterns used in a repository.
@@ -310,6 +330,26 @@ class TestingDetector:
             "WebMock": ["webmock"],
             "VCR": ["vcr"],
         }
+        
+        # Config file names as tuples for str.endswith
+        self._config_file_suffixes = {
+            framework: tuple(config_files)
+            for framework, config_files in self.config_files.items()
+        }
+        
+        # Precompile the file name, import and code patterns used in detect()
+        self._test_file_regexes = {
+            framework: [re.compile(pattern) for pattern in patterns]
+            for framework, patterns in self.test_file_patterns.items()
+        }
+        self._import_regexes = {
+            framework: [re.compile(pattern) for pattern in patterns]
+            for framework, patterns in self.import_patterns.items()
+        }
+        self._code_regexes = {
+            framework: [re.compile(pattern) for pattern in patterns]
+            for framework, patterns in self.code_patterns.items()
+        }
     
     # NEW METHOD: Apply context validation to reduce false positives
     def _apply_context_validation(self, testing_matches, testing_categories, files_content):
@@ -338,15 +378,9 @@ class TestingDetector:
         else:
             # Validate React Testing Library
             if "React Testing Library" in testing_matches:
-                rtl_specific_patterns = [
-                    r"from\s+['\"]\@testing-library\/react['\"]", 
-                    r"import\s+.*\s+from\s+['\"]\@testing-library\/react['\"]",
-                    r"render\(\s*<.*\/>\s*\)", r"screen\.getByText"
-                ]
-                
                 has_specific_rtl = False
                 for _, content in files_content.items():
-                    if any(re.search(pattern, content) for pattern in rtl_specific_patterns):
+                    if any(regex.search(content) for regex in _RTL_SPECIFIC_REGEXES):
                         has_specific_rtl = True
                         break
                 
@@ -355,15 +389,9 @@ class TestingDetector:
             
             # Validate Enzyme
             if "Enzyme" in testing_matches:
-                enzyme_specific_patterns = [
-                    r"from\s+['\"]enzyme['\"]", 
-                    r"import\s+.*\s+from\s+['\"]enzyme['\"]",
-                    r"shallow\(\s*<.*\/>\s*\)", r"mount\(\s*<.*\/>\s*\)"
-                ]
-                
                 has_specific_enzyme = False
                 for _, content in files_content.items():
-                    if any(re.search(pattern, content) for pattern in enzyme_specific_patterns):
+                    if any(regex.search(content) for regex in _ENZYME_SPECIFIC_REGEXES):
                         has_specific_enzyme = True
                         break
                 
@@ -377,16 +405,9 @@ class TestingDetector:
         else:
             # Validate RSpec
             if "RSpec" in testing_matches:
-                rspec_specific_patterns = [
-                    r"require\s+['\"]rspec['\"]", 
-                    r"RSpec\.describe", 
-                    r"describe\s+.*\s+do\s+", 
-                    r"it\s+['\"].*['\"]\s+do"
-                ]
-                
                 has_specific_rspec = False
                 for _, content in files_content.items():
-                    if any(re.search(pattern, content) for pattern in rspec_specific_patterns):
+                    if any(regex.search(content) for regex in _RSPEC_SPECIFIC_REGEXES):
                         has_specific_rspec = True
                         break
                 
@@ -450,19 +471,20 @@ class TestingDetector:
             filename = os.path.basename(file_path)
             
             # General test file patterns
-            for framework, patterns in self.test_file_patterns.items():
-                for pattern in patterns:
-                    if re.match(pattern, filename):
+            for framework, regexes in self._test_file_regexes.items():
+                for regex in regexes:
+                    if regex.match(filename):
                         testing_matches[framework] += 5
                         
                         # Set category if not already set
                         if framework not in testing_categories:
                             # Try to determine category
-                            if "unit" in file_path.lower():
+                            path_lower = file_path.lower()
+                            if "unit" in path_lower:
                                 testing_categories[framework] = "unit"
-                            elif "integration" in file_path.lower():
+                            elif "integration" in path_lower:
                                 testing_categories[framework] = "integration"
-                            elif "e2e" in file_path.lower() or "end-to-end" in file_path.lower():
+                            elif "e2e" in path_lower or "end-to-end" in path_lower:
                                 testing_categories[framework] = "e2e"
                             else:
                                 testing_categories[framework] = "general"
@@ -471,18 +493,20 @@ class TestingDetector:
                         break
             
             # Check for testing framework config files
-            for framework, config_files in self.config_files.items():
-                if filename in config_files or any(filename.endswith(f) for f in config_files):
+            # An exact name match is also a suffix match, so one endswith call
+            # with the tuple of config names covers both checks
+            for framework, config_suffixes in self._config_file_suffixes.items():
+                if filename.endswith(config_suffixes):
                     testing_matches[framework] += 15  # High weight for config files
                     
                     # Set category if not already set
                     if framework not in testing_categories:
                         # Categorize based on framework type
-                        if framework in ["Cypress", "Playwright", "Selenium", "Nightwatch", "Protractor", "TestCafe", "WebdriverIO"]:
+                        if framework in {"Cypress", "Playwright", "Selenium", "Nightwatch", "Protractor", "TestCafe", "WebdriverIO"}:
                             testing_categories[framework] = "e2e"
-                        elif framework in ["JMeter", "K6", "Artillery", "Gatling", "Locust"]:
+                        elif framework in {"JMeter", "K6", "Artillery", "Gatling", "Locust"}:
                             testing_categories[framework] = "performance"
-                        elif framework in ["Cucumber", "Robot Framework"]:
+                        elif framework in {"Cucumber", "Robot Framework"}:
                             testing_categories[framework] = "bdd"
                         else:
                             testing_categories[framework] = "general"
@@ -491,10 +515,10 @@ class TestingDetector:
         
         # Step 3: Check for package.json dependencies
         for file_path, content in files_content.items():
-            if os.path.basename(file_path) == "package.json":
+            filename = os.path.basename(file_path)
+            if filename == "package.json":
                 try:
-                    import json
-                    package_data = json.loads(content)
+                    package_data = parse_json_content(content)
                     
                     # Check dependencies and devDependencies
                     for dep_type in ["dependencies", "devDependencies"]:
@@ -507,9 +531,9 @@ class TestingDetector:
                                         testing_matches[framework] += 15
                                         
                                         # Categorize based on framework type
-                                        if framework in ["Cypress", "Playwright", "Selenium", "Nightwatch", "Protractor", "TestCafe", "WebdriverIO", "Puppeteer"]:
+                                        if framework in {"Cypress", "Playwright", "Selenium", "Nightwatch", "Protractor", "TestCafe", "WebdriverIO", "Puppeteer"}:
                                             testing_categories[framework] = "e2e"
-                                        elif framework in ["Jest", "Mocha", "Jasmine", "Vitest", "AVA", "Tape", "QUnit"]:
+                                        elif framework in {"Jest", "Mocha", "Jasmine", "Vitest", "AVA", "Tape", "QUnit"}:
                                             testing_categories[framework] = "unit"
                                         else:
                                             testing_categories[framework] = "general"
@@ -520,20 +544,20 @@ class TestingDetector:
                     pass
             
             # Check for Python requirements files
-            elif os.path.basename(file_path) in ["requirements.txt", "Pipfile", "pyproject.toml", "requirements.in"]:
+            elif filename in {"requirements.txt", "Pipfile", "pyproject.toml", "requirements.in"}:
                 for framework, packages in self.python_dependencies.items():
                     for pkg in packages:
                         if pkg in content:
                             testing_matches[framework] += 15
                             
                             # Categorize based on framework type
-                            if framework in ["Selenium", "Playwright"]:
+                            if framework in {"Selenium", "Playwright"}:
                                 testing_categories[framework] = "e2e"
-                            elif framework in ["PyTest", "unittest", "Nose"]:
+                            elif framework in {"PyTest", "unittest", "Nose"}:
                                 testing_categories[framework] = "unit"
-                            elif framework in ["Behave", "Lettuce", "Cucumber", "PyTest-BDD", "Robot Framework"]:
+                            elif framework in {"Behave", "Lettuce", "Cucumber", "PyTest-BDD", "Robot Framework"}:
                                 testing_categories[framework] = "bdd"
-                            elif framework in ["Locust"]:
+                            elif framework == "Locust":
                                 testing_categories[framework] = "performance"
                             else:
                                 testing_categories[framework] = "general"
@@ -541,18 +565,18 @@ class TestingDetector:
                             testing_evidence[framework].append(f"Found in requirements: {pkg}")
             
             # Check for Ruby Gemfile
-            elif os.path.basename(file_path) in ["Gemfile", "Gemfile.lock"]:
+            elif filename in {"Gemfile", "Gemfile.lock"}:
                 for framework, packages in self.ruby_dependencies.items():
                     for pkg in packages:
                         if pkg in content:
                             testing_matches[framework] += 15
                             
                             # Categorize based on framework type
-                            if framework in ["Capybara"]:
+                            if framework == "Capybara":
                                 testing_categories[framework] = "e2e"
-                            elif framework in ["RSpec", "MiniTest"]:
+                            elif framework in {"RSpec", "MiniTest"}:
                                 testing_categories[framework] = "unit"
-                            elif framework in ["Cucumber"]:
+                            elif framework == "Cucumber":
                                 testing_categories[framework] = "bdd"
                             else:
                                 testing_categories[framework] = "general"
@@ -565,10 +589,12 @@ class TestingDetector:
             if len(content) > 500000:  # Skip files over 500KB
                 continue
             
+            filename = os.path.basename(file_path)
+            
             # Check for testing framework imports
-            for framework, patterns in self.import_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
+            for framework, regexes in self._import_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         match_count = len(matches)
                         if match_count > 10:
@@ -579,9 +605,9 @@ class TestingDetector:
                         # Set category if not already set
                         if framework not in testing_categories:
                             # Categorize based on framework type
-                            if framework in ["Cypress", "Playwright", "Selenium"]:
+                            if framework in {"Cypress", "Playwright", "Selenium"}:
                                 testing_categories[framework] = "e2e"
-                            elif framework in ["Jest", "Mocha", "PyTest", "unittest", "JUnit", "RSpec"]:
+                            elif framework in {"Jest", "Mocha", "PyTest", "unittest", "JUnit", "RSpec"}:
                                 testing_categories[framework] = "unit"
                             else:
                                 testing_categories[framework] = "general"
@@ -592,13 +618,13 @@ class TestingDetector:
                             if len(match_text) > 60:  # Truncate long matches
                                 match_text = match_text[:57] + "..."
                             testing_evidence[framework].append(
-                                f"Found import in {os.path.basename(file_path)}: {match_text}"
+                                f"Found import in {filename}: {match_text}"
                             )
             
             # Check for testing framework code patterns
-            for framework, patterns in self.code_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
+            for framework, regexes in self._code_regexes.items():
+                for regex in regexes:
+                    matches = regex.findall(content)
                     if matches:
                         match_count = len(matches)
                         if match_count > 10:
@@ -609,11 +635,11 @@ class TestingDetector:
                         # Set category if not already set
                         if framework not in testing_categories:
                             # Categorize based on framework type
-                            if framework in ["Cypress", "Playwright", "Selenium"]:
+                            if framework in {"Cypress", "Playwright", "Selenium"}:
                                 testing_categories[framework] = "e2e"
-                            elif framework in ["Jest", "Mocha", "PyTest", "unittest", "JUnit", "RSpec"]:
+                            elif framework in {"Jest", "Mocha", "PyTest", "unittest", "JUnit", "RSpec"}:
                                 testing_categories[framework] = "unit"
-                            elif framework in ["Cucumber", "Robot Framework"]:
+                            elif framework in {"Cucumber", "Robot Framework"}:
                                 testing_categories[framework] = "bdd"
                             else:
                                 testing_categories[framework] = "general"
@@ -624,7 +650,7 @@ class TestingDetector:
                             if len(match_text) > 60:  # Truncate long matches
                                 match_text = match_text[:57] + "..."
                             testing_evidence[framework].append(
-                                f"Found code pattern in {os.path.basename(file_path)}: {match_text}"
+                                f"Found code pattern in {filename}: {match_text}"
                             )
         
         # Step 5: Apply context validation to reduce false positives
@@ -640,9 +666,10 @@ class TestingDetector:
                     test_extensions[ext] = test_extensions.get(ext, 0) + 1
             
             # Count source files for each extension
+            test_file_set = set(test_files)
             source_extensions = {}
             for file_path in files:
-                if file_path not in test_files:  # Skip test files
+                if file_path not in test_file_set:  # Skip test files
                     _, ext = os.path.splitext(file_path)
                     if ext:
                         source_extensions[ext] = source_extensions.get(ext, 0) + 1
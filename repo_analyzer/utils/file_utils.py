@@ -6,12 +6,52 @@ finding files, loading file content, and other file-related operations
 that support the repository analysis process.
 """
 
+import io
 import os
+import json
 import logging
-from typing import Dict, List, Set, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Set, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional, faster JSON parser
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Extensions and file names whose content is loaded for deeper analysis.
+# All of them are text formats.
+_RELEVANT_EXTENSIONS = frozenset({
+    # Code files
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.go', '.rb', '.php', '.cs',
+    '.rs', '.c', '.cpp', '.swift', '.kt', '.scala', '.sh', '.bash', '.ps1',
+    
+    # Web files
+    '.html', '.css', '.scss', '.less', '.vue', '.svelte', 
+    
+    # Config files
+    '.json', '.yml', '.yaml', '.xml', '.toml', '.ini', '.conf', '.properties',
+    '.gradle', '.lock', '.mod', '.sum', '.csproj', '.sln',
+    
+    # Package files
+    'Gemfile', 'Rakefile', 'Dockerfile', 'Makefile', 'requirements.txt',
+    'package.json', 'composer.json', 'pom.xml', 'build.gradle',
+    
+    # Special cases
+    '.gitignore', '.dockerignore'
+})
+
+# Extensions of files that are commonly shipped minified (bundles, vendored CSS)
+_MINIFIABLE_EXTENSIONS = frozenset({'.js', '.css'})
+
+# Size of the leading chunk inspected before a file is read in full
+_SNIFF_SIZE = 4096
+
+# Translation table deleting control characters other than newline, carriage return and tab
+_CONTROL_CHARS_TABLE = {c: None for c in range(32) if chr(c) not in '\n\r\t'}
+
 def get_all_files(repo_path: str, exclude_dirs: Optional[Set[str]] = None) -> List[str]:
     """
     Get all files in the repository, excluding specified directories.
@@ -30,149 +70,190 @@ def get_all_files(repo_path: str, exclude_dirs: Optional[Set[str]] = None) -> Li
     all_files = []
     exclude_dirs = exclude_dirs or set()
     
-    for root, dirs, files in os.walk(repo_path):
-        # Skip excluded directories by modifying dirs in-place
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
+    # Walk with os.scandir so the d_type information cached on each DirEntry
+    # answers is_dir() without an extra stat call per entry. Directories are
+    # visited depth-first in the same order os.walk would use.
+    pending = [(repo_path, '')]
+    while pending:
+        dir_path, prefix = pending.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                entries = list(entries)
+        except OSError as e:
+            logger.debug(f"Error scanning directory {dir_path}: {str(e)}")
+            continue
         
-        for file in files:
-            file_path = os.path.join(root, file)
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
             
-            # Get path relative to repo_path
-            relative_path = os.path.relpath(file_path, repo_path)
-            all_files.append(relative_path)
+            if not is_dir:
+                # Store the path relative to repo_path
+                all_files.append(prefix + entry.name)
+            elif entry.name not in exclude_dirs and not entry.is_symlink():
+                # Skip excluded directories and, like os.walk, symlinked ones
+                subdirs.append((entry.path, prefix + entry.name + os.sep))
+        
+        # Push in reverse so subdirectories are popped in listing order
+        pending.extend(reversed(subdirs))
     
     return all_files
 
-def load_files_content(repo_path: str, files: List[str], max_file_size: int = 5 * 1024 * 1024) -> Dict[str, str]:
+def load_files_content(repo_path: str, files: List[str], max_file_size: int = 5 * 1024 * 1024,
+                       max_workers: Optional[int] = None) -> Dict[str, str]:
     """
     Load content of relevant files for deeper analysis.
     
     This function loads the content of files that might contain useful information
     for the technology stack analysis, focusing on certain file extensions and
-    respecting a maximum file size to avoid memory issues.
+    respecting a maximum file size to avoid memory issues. Files are read by a
+    thread pool, since the work is dominated by open/stat/read system calls
+    which release the GIL.
     
     Args:
         repo_path: Path to the repository
         files: List of file paths (relative to repo_path)
         max_file_size: Maximum file size in bytes to load (default: 5MB)
+        max_workers: Number of reader threads (default: ThreadPoolExecutor's default)
         
     Returns:
         Dict mapping file paths to their content
     """
     content = {}
     
-    # Define relevant extensions for content analysis
-    relevant_extensions = {
-        # Code files
-        '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.go', '.rb', '.php', '.cs',
-        '.rs', '.c', '.cpp', '.swift', '.kt', '.scala', '.sh', '.bash', '.ps1',
-        
-        # Web files
-        '.html', '.css', '.scss', '.less', '.vue', '.svelte', 
-        
-        # Config files
-        '.json', '.yml', '.yaml', '.xml', '.toml', '.ini', '.conf', '.properties',
-        '.gradle', '.lock', '.mod', '.sum', '.csproj', '.sln',
-        
-        # Package files
-        'Gemfile', 'Rakefile', 'Dockerfile', 'Makefile', 'requirements.txt',
-        'package.json', 'composer.json', 'pom.xml', 'build.gradle',
-        
-        # Special cases
-        '.gitignore', '.dockerignore'
-    }
-    
     # Total files to process
     total_files = len(files)
-    processed = 0
     skipped_size = 0
     skipped_ext = 0
+    skipped_minified = 0
     skipped_error = 0
     
+    # Check if each file should be analyzed (by extension or full filename)
+    candidates = []
     for file_path in files:
-        processed += 1
-        if processed % 100 == 0:
-            logger.debug(f"Processing file {processed}/{total_files}")
-        
-        # Check file extension
         _, ext = os.path.splitext(file_path)
         filename = os.path.basename(file_path)
         
-        # Check if file should be analyzed (by extension or full filename)
-        if ext.lower() in relevant_extensions or filename in relevant_extensions:
-            full_path = os.path.join(repo_path, file_path)
-            
-            try:
-                # Check file size
-                file_size = os.path.getsize(full_path)
-                if file_size > max_file_size:
-                    logger.debug(f"Skipping large file: {file_path} ({file_size} bytes)")
-                    skipped_size += 1
-                    continue
-                
-                # Check if it's likely a binary file (simple heuristic)
-                if _is_likely_binary(full_path):
-                    logger.debug(f"Skipping likely binary file: {file_path}")
-                    skipped_ext += 1
-                    continue
-                
-                # Load file content
-                with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    file_content = f.read()
-                    
-                    # Only store non-empty content
-                    if file_content.strip():
-                        content[file_path] = file_content
-                    
-            except Exception as e:
-                logger.debug(f"Error reading file {file_path}: {str(e)}")
-                skipped_error += 1
+        if ext.lower() in _RELEVANT_EXTENSIONS or filename in _RELEVANT_EXTENSIONS:
+            candidates.append(file_path)
         else:
             skipped_ext += 1
     
-    logger.debug(f"Files processed: {processed}, content loaded: {len(content)}")
-    logger.debug(f"Files skipped - size: {skipped_size}, extension: {skipped_ext}, error: {skipped_error}")
+    # Read candidate files concurrently; map() keeps results in input order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda file_path: _read_file_content(repo_path, file_path, max_file_size),
+            candidates
+        )
+        
+        for processed, (file_path, (file_content, status)) in enumerate(zip(candidates, results), 1):
+            if processed % 100 == 0:
+                logger.debug(f"Processing file {processed}/{len(candidates)}")
+            
+            if status == "size":
+                skipped_size += 1
+            elif status == "binary":
+                skipped_ext += 1
+            elif status == "minified":
+                skipped_minified += 1
+            elif status == "error":
+                skipped_error += 1
+            elif file_content is not None:
+                content[file_path] = file_content
+    
+    logger.debug(f"Files processed: {total_files}, content loaded: {len(content)}")
+    logger.debug(f"Files skipped - size: {skipped_size}, extension: {skipped_ext}, "
+                 f"minified: {skipped_minified}, error: {skipped_error}")
     
     return content
 
-def _is_likely_binary(file_path: str) -> bool:
+def _read_file_content(repo_path: str, file_path: str, max_file_size: int) -> Tuple[Optional[str], str]:
     """
-    Check if a file is likely binary using a simple heuristic.
+    Read a single file for content analysis.
     
     Args:
-        file_path: Path to the file
+        repo_path: Path to the repository
+        file_path: File path relative to repo_path
+        max_file_size: Maximum file size in bytes to load
         
     Returns:
-        True if the file is likely binary, False otherwise
-    """
-    # Common binary file extensions
-    binary_extensions = {
-        '.png', '.jpg', '.jpeg', '.gif', '.ico', '.pdf', '.zip', '.gz', '.tar',
-        '.jar', '.class', '.pyc', '.pyd', '.so', '.dll', '.exe', '.bin', '.dat',
-        '.db', '.sqlite', '.o', '.obj', '.a', '.lib', '.dylib', '.iso', '.mp3',
-        '.mp4', '.avi', '.mov', '.wmv', '.flv', '.wav', '.ogg', '.woff', '.woff2',
-        '.ttf', '.eot', '.svg'
-    }
-    
-    # Check extension
-    _, ext = os.path.splitext(file_path)
-    if ext.lower() in binary_extensions:
-        return True
-    
-    # Read a small chunk to check for binary data
+        Tuple of (content, status) where status is one of "loaded", "size",
+        "binary", "minified" or "error". Content is None unless the file was
+        loaded and is non-empty.
+    """
+    full_path = os.path.join(repo_path, file_path)
+    
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            chunk = f.read(1024)
-            # Count control characters (except common ones like newline, tab)
-            control_chars = sum(1 for c in chunk if ord(c) < 32 and c not in '\n\r\t')
-            # If more than 10% are control characters, likely binary
-            if len(chunk) > 0 and control_chars / len(chunk) > 0.1:
-                return True
-    except Exception:
-        # If we can't read it as text, it's likely binary
-        return True
-    
-    return False
+        # No binary-extension check is needed here: callers only pass files
+        # matching _RELEVANT_EXTENSIONS, which are all text formats
+        # The buffer is at least _SNIFF_SIZE bytes so peek() below can see
+        # the whole sniffed head
+        with open(full_path, 'rb', buffering=2 * _SNIFF_SIZE) as raw:
+            # Check file size on the open descriptor rather than
+            # resolving the path a second time
+            file_size = os.fstat(raw.fileno()).st_size
+            if file_size > max_file_size:
+                logger.debug(f"Skipping large file: {file_path} ({file_size} bytes)")
+                return None, "size"
+            
+            # A NUL byte is a sure sign of binary data (the same test git
+            # uses). This is the only NUL check: it runs on the raw head, which
+            # spans every character _looks_binary inspects, before anything is
+            # decoded. peek() fills the read buffer without consuming it
+            if b'\x00' in raw.peek(_SNIFF_SIZE)[:_SNIFF_SIZE]:
+                logger.debug(f"Skipping likely binary file: {file_path}")
+                return None, "binary"
+            
+            with io.TextIOWrapper(raw, encoding='utf-8', errors='ignore') as f:
+                # Sniff the start of the file before reading the rest, so binary
+                # and minified files are rejected without being loaded in full
+                head = f.read(_SNIFF_SIZE)
+                if _looks_binary(head[:1024]):
+                    logger.debug(f"Skipping likely binary file: {file_path}")
+                    return None, "binary"
+                
+                # A JS/CSS file whose first few KB hold fewer than two line
+                # breaks is a minified bundle; its content only produces noisy
+                # matches. Other formats (e.g. single-line JSON manifests) are
+                # still loaded, since detectors rely on them
+                if (len(head) == _SNIFF_SIZE and head.count('\n') < 2 and
+                        os.path.splitext(file_path)[1].lower() in _MINIFIABLE_EXTENSIONS):
+                    logger.debug(f"Skipping minified file: {file_path}")
+                    return None, "minified"
+                
+                # Load the rest of the file content
+                file_content = head + f.read()
+        
+        # Only store non-empty content. isspace() answers this without the
+        # full-size copy that strip() would allocate
+        has_content = file_content and not file_content.isspace()
+        return (file_content if has_content else None), "loaded"
+        
+    except OSError as e:
+        # Decoding uses errors='ignore', so only I/O failures can occur here
+        logger.debug(f"Error reading file {file_path}: {str(e)}")
+        return None, "error"
+
+def _looks_binary(chunk: str) -> bool:
+    """
+    Check if the start of a file's decoded content looks like binary data.
+    
+    Args:
+        chunk: The first characters of the file content
+        
+    Returns:
+        True if more than 10% of the chunk's characters are control characters
+    """
+    if not chunk:
+        return False
+    
+    # Count control characters (except common ones like newline, tab) by
+    # deleting them with str.translate, which runs in C
+    control_chars = len(chunk) - len(chunk.translate(_CONTROL_CHARS_TABLE))
+    return control_chars / len(chunk) > 0.1
 
 def get_directory_structure(repo_path: str, exclude_dirs: Optional[Set[str]] = None) -> Dict:
     """
@@ -191,23 +272,36 @@ def get_directory_structure(repo_path: str, exclude_dirs: Optional[Set[str]] = N
     exclude_dirs = exclude_dirs or set()
     structure = {}
     
-    for root, dirs, files in os.walk(repo_path):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
-        
-        # Get path relative to repo_path
-        path = os.path.relpath(root, repo_path)
-        if path == '.':
-            # Skip root directory
+    # Walk with os.scandir, carrying each directory's parent dict alongside
+    # its path so no relative path has to be computed and split per directory
+    pending = [(repo_path, None, None)]
+    while pending:
+        dir_path, parent, name = pending.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                entries = list(entries)
+        except OSError as e:
+            logger.debug(f"Error scanning directory {dir_path}: {str(e)}")
             continue
         
-        # Create nested dictionary
-        parts = path.split(os.sep)
-        current = structure
-        for part in parts:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+        # Like os.walk, only record a directory once it could be listed
+        node = structure if parent is None else parent.setdefault(name, {})
+        
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+        
+            # Only real, non-excluded directories become nodes; symlinks are
+            # not followed, matching get_all_files
+            if is_dir and entry.name not in exclude_dirs and not entry.is_symlink():
+                subdirs.append((entry.path, node, entry.name))
+        
+        # Reversed so children are visited, and inserted into the dict, in
+        # the order os.walk would add them
+        pending.extend(reversed(subdirs))
     
     return structure
 
@@ -243,10 +337,25 @@ def find_files_matching_patterns(files: List[str], patterns: List[str]) -> List[
     Returns:
         List of file paths that match any pattern
     """
-    matching_files = []
+    return [file_path for file_path in files
+            if any(pattern in file_path for pattern in patterns)]
+
+def parse_json_content(content: str) -> Any:
+    """
+    Parse JSON file content, such as a loaded package.json.
     
-    for file_path in files:
-        if any(pattern in file_path for pattern in patterns):
-            matching_files.append(file_path)
+    Uses orjson when it is installed and falls back to the standard
+    json module otherwise.
     
-    return matching_files
\ No newline at end of file
+    Args:
+        content: JSON text
+        
+    Returns:
+        The parsed JSON value
+        
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
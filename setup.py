@@ -42,6 +42,9 @@ setup(
         'local_ai': [
             'llama-cpp-python>=0.2.0',
             'sentence-transformers>=2.2.2',
+        ],
+        'fast': [
+            'orjson>=3.0.0',
         ]
     },
     entry_points={
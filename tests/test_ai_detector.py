@@ -13,7 +13,7 @@ from unittest.mock import patch, MagicMock, mock_open
 from pathlib import Path
 
 from repo_analyzer.ai.ai_integration import AIIntegration
-from repo_analyzer.ai.ai_detector import AIDetector
+from repo_analyzer.ai.ai_detector import AIDetector, _reservoir_sample
 
 # Sample code for testing
 PYTHON_CODE_SAMPLE = """
@@ -515,5 +515,37 @@ class TestAIDetector(unittest.TestCase):
         self.assertEqual(result["suggestions"][0]["severity"], "high")
 
 
+
+class TestReservoirSample(unittest.TestCase):
+    """Test cases for the reservoir sampling helper."""
+    
+    def test_returns_everything_when_k_covers_input(self):
+        """Test that every item is kept, in order, when k >= the input size."""
+        items = ["a.py", "b.py", "c.py"]
+        
+        self.assertEqual(_reservoir_sample(items, 3), items)
+        self.assertEqual(_reservoir_sample(items, 10), items)
+        self.assertEqual(_reservoir_sample(iter(items), 10), items)
+    
+    def test_sample_size(self):
+        """Test that exactly k items are selected from a larger input."""
+        items = [f"file_{i}.py" for i in range(100)]
+        
+        for k in (1, 5, 99):
+            sample = _reservoir_sample(items, k)
+            self.assertEqual(len(sample), k)
+            self.assertEqual(len(set(sample)), k)  # No item is picked twice
+        
+        self.assertEqual(_reservoir_sample(items, 0), [])
+        self.assertEqual(_reservoir_sample([], 5), [])
+    
+    def test_samples_only_from_input(self):
+        """Test that every selected item comes from the input, including generators."""
+        items = [f"file_{i}.py" for i in range(50)]
+        
+        for _ in range(20):
+            sample = _reservoir_sample((item for item in items), 10)
+            self.assertTrue(set(sample) <= set(items))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -7,10 +7,12 @@ and validates the cross-detector integration in the enhanced version.
 
 import os
 import sys
+import json
 import unittest
 import tempfile
 import shutil
 from typing import Dict, Any
+from unittest import mock
 
 # Import RepoAnalyzer
 from repo_analyzer import RepoAnalyzer
@@ -871,5 +873,47 @@ A minimal repository for testing.
         # There should be no testing frameworks detected
         self.assertEqual(len(tech_stack["testing"]), 0)
 
+    def test_parallel_detectors_match_serial(self):
+        """Test that running detectors in worker processes gives the same results."""
+        serial_stack = RepoAnalyzer(self.mixed_repo).analyze()
+        parallel_stack = RepoAnalyzer(self.mixed_repo, jobs=4).analyze()
+
+        for category in ["languages", "frameworks", "databases", "build_systems",
+                         "package_managers", "frontend", "devops", "architecture", "testing"]:
+            self.assertEqual(
+                {tech: details["confidence"] for tech, details in serial_stack[category].items()},
+                {tech: details["confidence"] for tech, details in parallel_stack[category].items()}
+            )
+
+    def test_cli_jobs_option(self):
+        """Test that --jobs runs the detectors in a worker pool from the CLI."""
+        from repo_analyzer import analyzer, cli
+
+        pool_sizes = []
+        real_executor = analyzer.ProcessPoolExecutor
+
+        def recording_executor(*args, **kwargs):
+            pool_sizes.append(kwargs.get("max_workers"))
+            return real_executor(*args, **kwargs)
+
+        results = {}
+        for jobs in ("1", "2"):
+            output_path = os.path.join(self.test_dir, f"result_{jobs}.json")
+            argv = ["repo-analyzer", self.mixed_repo, "--jobs", jobs, "--format", "json",
+                    "--output", output_path, "--quiet", "--min-confidence", "0"]
+            with mock.patch.object(sys, "argv", argv), \
+                 mock.patch.object(analyzer, "ProcessPoolExecutor", side_effect=recording_executor):
+                self.assertEqual(cli.main(), 0)
+            with open(output_path) as f:
+                results[jobs] = json.load(f)
+
+        # Only the --jobs 2 run should have started a pool, with two workers
+        self.assertEqual(pool_sizes, [2])
+
+        # Apart from timing metadata, the reports should be identical
+        for result in results.values():
+            result.pop("metadata", None)
+        self.assertEqual(results["1"], results["2"])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Test cases for the file utilities used by RepoAnalyzer.
+
+This module tests how repositories are walked and how file content is loaded
+for analysis, including the rules that skip files whose content would only
+produce noisy matches.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from repo_analyzer.utils import file_utils
+from repo_analyzer.utils.file_utils import (
+    get_all_files, get_directory_structure, load_files_content, _looks_binary
+)
+
+class TestGetAllFiles(unittest.TestCase):
+    """Test cases for get_all_files."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        for file_path in ["setup.py", "src/app/main.py", "src/app/utils.py",
+                          "docs/index.md", "node_modules/react/index.js"]:
+            full_path = os.path.join(self.test_dir, *file_path.split("/"))
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as f:
+                f.write("x = 1\n")
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+    
+    def test_relative_nested_paths(self):
+        """Test that nested files are returned relative to the repository root."""
+        files = get_all_files(self.test_dir)
+        
+        self.assertEqual(sorted(files), sorted([
+            "setup.py",
+            os.path.join("src", "app", "main.py"),
+            os.path.join("src", "app", "utils.py"),
+            os.path.join("docs", "index.md"),
+            os.path.join("node_modules", "react", "index.js"),
+        ]))
+        for file_path in files:
+            self.assertFalse(os.path.isabs(file_path))
+            self.assertTrue(os.path.isfile(os.path.join(self.test_dir, file_path)))
+    
+    def test_excluded_dirs_skipped(self):
+        """Test that excluded directories are skipped at any depth."""
+        files = get_all_files(self.test_dir, {"node_modules", "app"})
+        
+        self.assertEqual(sorted(files), sorted(["setup.py", os.path.join("docs", "index.md")]))
+    
+    def test_symlinks(self):
+        """Test that symlinked directories are not followed but symlinked files are listed."""
+        os.symlink(os.path.join(self.test_dir, "src"), os.path.join(self.test_dir, "src_link"))
+        os.symlink(os.path.join(self.test_dir, "setup.py"), os.path.join(self.test_dir, "setup_link.py"))
+        
+        files = get_all_files(self.test_dir, {"node_modules"})
+        
+        self.assertIn("setup_link.py", files)
+        self.assertNotIn("src_link", files)
+        self.assertFalse(any(f.startswith("src_link" + os.sep) for f in files))
+    
+    def test_matches_os_walk(self):
+        """Test that the same files are listed as by an os.walk traversal."""
+        expected = []
+        for root, dirs, names in os.walk(self.test_dir):
+            dirs[:] = [d for d in dirs if d != "node_modules"]
+            rel_root = os.path.relpath(root, self.test_dir)
+            expected.extend(name if rel_root == "." else os.path.join(rel_root, name)
+                            for name in names)
+        
+        files = get_all_files(self.test_dir, {"node_modules"})
+        
+        self.assertEqual(sorted(files), sorted(expected))
+
+class TestLoadFilesContent(unittest.TestCase):
+    """Test cases for load_files_content."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+    
+    def _write(self, file_path, data):
+        """Write raw bytes to a file inside the test directory."""
+        with open(os.path.join(self.test_dir, file_path), "wb") as f:
+            f.write(data)
+        return file_path
+    
+    def test_minified_bundle_skipped(self):
+        """Test that one-line JS bundles are skipped while normal files load."""
+        statement = b"var a=require('react');"
+        normal_js = self._write("app.js", b"import React from 'react';\n" * 400)
+        bundle_js = self._write("vendor.min.js", statement * 400)
+        # A license header line does not stop a bundle from being detected
+        headed_js = self._write("lib.js", b"/*! lib v1.0 */\n" + statement * 400)
+        # Only JS/CSS are treated as minifiable; a single-line manifest still loads
+        single_line_json = self._write("package.json", b'{"name": "x", "deps": "' + b"a" * 5000 + b'"}')
+        
+        content = load_files_content(self.test_dir, [normal_js, bundle_js, headed_js, single_line_json])
+        
+        self.assertEqual(set(content), {normal_js, single_line_json})
+    
+    def test_nul_bytes_rejected(self):
+        """Test that files with a NUL near the start are treated as binary."""
+        text_py = self._write("app.py", b"import os\nprint(os.getcwd())\n")
+        nul_py = self._write("blob.py", b"import os\n\x00\x01\x02payload")
+        # The NUL check covers the raw 4 KB head, so a NUL after multi-byte
+        # text (byte 1250, character 750) is still caught
+        late_nul_py = self._write("late.py", "éé\n".encode("utf-8") * 250 + b"\x00")
+        # A NUL well past the sniffed head does not make a file binary
+        tail_nul_py = self._write("tail.py", b"x = 1\n" * 1000 + b"\x00")
+        
+        content = load_files_content(self.test_dir, [text_py, nul_py, late_nul_py, tail_nul_py])
+        
+        self.assertEqual(set(content), {text_py, tail_nul_py})
+    
+    def test_looks_binary(self):
+        """Test the decoded-head control-character heuristic."""
+        self.assertTrue(_looks_binary("\x01\x02\x03" + "a" * 10))
+        self.assertFalse(_looks_binary("\x01" + "a" * 20))
+        self.assertFalse(_looks_binary("def main():\n\treturn 1\r\n"))
+        self.assertFalse(_looks_binary(""))
+
+class TestGetDirectoryStructure(unittest.TestCase):
+    """Test cases for get_directory_structure."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.test_dir, "src", "api", "v1"))
+        os.makedirs(os.path.join(self.test_dir, "src", "models"))
+        os.makedirs(os.path.join(self.test_dir, "node_modules", "react"))
+        with open(os.path.join(self.test_dir, "src", "main.py"), "w") as f:
+            f.write("print('hello')\n")
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+    
+    def test_nested_structure(self):
+        """Test that nested directories become nested dicts and files are left out."""
+        structure = get_directory_structure(self.test_dir, {"node_modules"})
+        
+        self.assertEqual(structure, {"src": {"api": {"v1": {}}, "models": {}}})
+    
+    def test_symlinked_directory_not_followed(self):
+        """Test that symlinked directories are skipped, as os.walk does."""
+        os.symlink(os.path.join(self.test_dir, "src"), os.path.join(self.test_dir, "link"))
+        
+        structure = get_directory_structure(self.test_dir, {"node_modules"})
+        
+        self.assertNotIn("link", structure)
+    
+    def test_unreadable_directory_skipped(self):
+        """Test that a directory which cannot be listed is left out entirely."""
+        unreadable = os.path.join(self.test_dir, "src", "models")
+        real_scandir = os.scandir
+        
+        def scandir(path):
+            if path == unreadable:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+        
+        with mock.patch.object(file_utils.os, "scandir", side_effect=scandir):
+            structure = get_directory_structure(self.test_dir, {"node_modules"})
+        
+        self.assertEqual(structure, {"src": {"api": {"v1": {}}}})
+
+if __name__ == "__main__":
+    unittest.main()